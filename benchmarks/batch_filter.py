@@ -0,0 +1,83 @@
+"""
+Time the POST /issues/batch_filter statement at 1k, 10k and 100k matching rows.
+
+Seeds 200k issues (plus authors and departments for the joins) in a scratch
+schema and runs the joined statement built by _batch_filter_query both buffered
+and streamed, reporting time to first row and total time. Mongo engagement
+lookups are excluded; they cost one aggregation per chunk regardless of size.
+
+    python -m benchmarks.batch_filter
+"""
+import asyncio
+import time
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from benchmarks.common import scratch_schema
+from services.issues.issue_services import BATCH_FILTER_FIELDS, BATCH_FILTER_STREAM_CHUNK, _batch_filter_query
+from utils.db import ASYNC_DATABASE_URL
+
+SCHEMA = "bench_batch_filter"
+ROWS = 200000
+
+SEED_AUTHORS = """
+INSERT INTO users (id, email, created_at)
+SELECT md5('user' || g)::uuid, 'user' || g || '@example.com', now() FROM generate_series(1, 1000) AS g;
+INSERT INTO profile (id, user_id, fullname, role, is_deleted)
+SELECT md5('profile' || g)::uuid, md5('user' || g)::uuid, 'User ' || g, 'citizen', 1
+FROM generate_series(1, 1000) AS g;
+INSERT INTO issue_depts (id, dept, location, category)
+SELECT md5('dept' || g)::uuid, 'Dept ' || g, 'state_' || (g % 30), 'general' FROM generate_series(1, 50) AS g;
+UPDATE issues SET user_id = md5('user' || (1 + abs(hashtext(id::text)) % 1000))::uuid,
+                  dept_id = md5('dept' || (1 + abs(hashtext(id::text)) % 50))::uuid;
+ANALYZE;
+"""
+
+# Roughly 1k, 10k and 100k live matches for the seed distribution in benchmarks.common
+CASES = {
+    "~1k rows": {"districts": [f"district_{i}" for i in range(3)]},
+    "~10k rows": {"districts": [f"district_{i}" for i in range(30)], "villages": ["village_1"]},
+    "~100k rows": {"states": [f"state_{i}" for i in range(15)], "taluks": ["taluk_1"]},
+}
+
+
+async def run_case(bench_engine, name, filters):
+    criteria = {field: filters.get(field) for field in BATCH_FILTER_FIELDS}
+    query = _batch_filter_query(criteria)
+
+    async with bench_engine.connect() as conn:
+        started = time.perf_counter()
+        rows = (await conn.execute(query)).all()
+        buffered = time.perf_counter() - started
+
+        started = time.perf_counter()
+        first_row = None
+        streamed = 0
+        result = await conn.stream(query.execution_options(yield_per=BATCH_FILTER_STREAM_CHUNK))
+        async for chunk in result.partitions():
+            if first_row is None:
+                first_row = time.perf_counter() - started
+            streamed += len(chunk)
+        total = time.perf_counter() - started
+
+    print(f"{name:>11}: {len(rows):>7} rows | buffered {buffered * 1000:8.1f} ms | "
+          f"streamed first chunk {(first_row or 0) * 1000:7.1f} ms, total {total * 1000:8.1f} ms")
+
+
+async def run_cases():
+    bench_engine = create_async_engine(
+        ASYNC_DATABASE_URL, connect_args={"server_settings": {"search_path": SCHEMA}})
+    try:
+        for name, filters in CASES.items():
+            await run_case(bench_engine, name, filters)
+    finally:
+        await bench_engine.dispose()
+
+
+def main():
+    with scratch_schema(SCHEMA, ROWS) as conn:
+        conn.exec_driver_sql(SEED_AUTHORS)
+        asyncio.run(run_cases())
+
+
+if __name__ == "__main__":
+    main()
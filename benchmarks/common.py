@@ -0,0 +1,45 @@
+from contextlib import contextmanager
+from sqlalchemy import text
+from models.base import Base
+import models  # noqa: F401  registers every table on Base.metadata
+from utils.db import engine
+
+SEED_ISSUES = """
+INSERT INTO issues (id, issue_headline, issue_desc, issue_dept, issue_type, state, district,
+                    taluk, village, dept_id, current_status, created_at, priority, is_deleted)
+SELECT md5(g::text)::uuid,
+       (ARRAY['Pothole', 'Water leak', 'Streetlight out', 'Garbage overflow', 'Power cut',
+              'Blocked drain', 'Broken footpath', 'Stray animals', 'Illegal dumping',
+              'Traffic signal fault'])[g % 10 + 1] || ' near village ' || (g % 20000),
+       'Residents report the ' || (ARRAY['road', 'pipeline', 'market', 'school', 'bus stand',
+              'hospital', 'canal'])[g % 7 + 1] || ' problem ' || (ARRAY['for weeks',
+              'since the monsoon', 'again', 'every night', 'after repairs',
+              'despite complaints'])[g % 6 + 1] || ', ticket ' || g,
+       '"dept"', '"type"',
+       'state_' || (g % 30), 'district_' || (g % 600), 'taluk_' || (g % 3000),
+       'village_' || (g % 20000), NULL, 'Pending', now() - g * interval '1 minute', 'low',
+       g % 20 = 0
+FROM generate_series(1, :rows) AS g
+"""
+
+
+@contextmanager
+def scratch_schema(schema: str, rows: int):
+    """
+    Create every model table in a throwaway schema, seed ``rows`` synthetic issues
+    and yield an autocommit connection whose search_path points at it.
+
+    Seeded values cycle through 30 states, 600 districts, 3000 taluks and
+    20000 villages; every 20th issue is soft-deleted.
+    """
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {schema}"))
+        conn.execute(text(f"SET search_path TO {schema}"))
+        try:
+            Base.metadata.create_all(conn)
+            conn.execute(text(SEED_ISSUES), {"rows": rows})
+            conn.execute(text("ANALYZE issues"))
+            yield conn
+        finally:
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
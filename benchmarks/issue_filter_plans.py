@@ -0,0 +1,58 @@
+"""
+Show /issues query plans before and after migration 0001 on a seeded dataset.
+
+Seeds a scratch schema with synthetic issues, prints EXPLAIN ANALYZE for the
+feed queries with no indexes, applies the 0001 index statements and prints the
+plans again. The scratch schema is dropped afterwards.
+
+    python -m benchmarks.issue_filter_plans --rows 500000
+"""
+import argparse
+from sqlalchemy import text
+from benchmarks.common import scratch_schema
+from utils.migrations import load_migrations
+
+SCHEMA = "bench_issue_filters"
+
+QUERIES = {
+    "feed": "SELECT * FROM issues WHERE is_deleted = false "
+            "ORDER BY created_at DESC, id DESC LIMIT 20",
+    "state": "SELECT * FROM issues WHERE is_deleted = false AND state = 'state_7' "
+             "ORDER BY created_at DESC, id DESC LIMIT 20",
+    "state+district": "SELECT * FROM issues WHERE is_deleted = false AND state = 'state_7' "
+                      "AND district = 'district_37' ORDER BY created_at DESC, id DESC LIMIT 20",
+    "village": "SELECT * FROM issues WHERE is_deleted = false AND village = 'village_1234' "
+               "ORDER BY created_at DESC, id DESC LIMIT 20",
+    "deep keyset page": "SELECT * FROM issues WHERE is_deleted = false AND state = 'state_7' "
+                        "AND (created_at, id) < (now() - interval '200 days', "
+                        "'ffffffff-ffff-ffff-ffff-ffffffffffff') "
+                        "ORDER BY created_at DESC, id DESC LIMIT 20",
+}
+
+
+def explain(conn, label):
+    print(f"\n===== {label} =====")
+    for name, sql in QUERIES.items():
+        plan = conn.execute(text("EXPLAIN (ANALYZE, BUFFERS, COSTS OFF) " + sql)).scalars().all()
+        print(f"\n--- {name}")
+        print("\n".join(plan))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200000)
+    args = parser.parse_args()
+
+    index_migration = next(module for version, _, module in load_migrations() if version == "0001")
+
+    with scratch_schema(SCHEMA, args.rows) as conn:
+        explain(conn, f"{args.rows} rows, primary key only")
+
+        for statement in index_migration.upgrade:
+            conn.execute(text(statement))
+        conn.execute(text("ANALYZE issues"))
+        explain(conn, f"{args.rows} rows, after 0001_issue_filter_indexes")
+
+
+if __name__ == "__main__":
+    main()
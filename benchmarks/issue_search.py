@@ -0,0 +1,73 @@
+"""
+Time /issues/search queries on a seeded dataset.
+
+Seeds a scratch schema with synthetic issues (the generated search_vector
+column comes from the model), builds the 0005 GIN index and reports the median
+execution time of each search over several runs, against a 50 ms budget.
+
+Selective terms stay well inside the budget at a million rows. A term that
+matches a large share of the table has to rank every match before LIMIT
+applies, so its cost grows with the number of matching rows rather than the
+table size; combining it with a feed filter keeps it bounded.
+
+    python -m benchmarks.issue_search --rows 1000000
+"""
+import argparse
+import json
+import statistics
+from sqlalchemy import text
+from benchmarks.common import scratch_schema
+from utils.migrations import load_migrations
+
+SCHEMA = "bench_issue_search"
+BUDGET_MS = 50
+
+SEARCH = """
+SELECT id, ts_rank_cd(search_vector, q) AS rank
+FROM issues, websearch_to_tsquery('english', :q) AS q
+WHERE is_deleted = false AND search_vector @@ q {extra}
+ORDER BY rank DESC, id DESC LIMIT 20
+"""
+
+QUERIES = {
+    "single village": ("village 1234", ""),
+    "phrase in one village": ('"water leak" 1234', ""),
+    "ticket number": ("ticket 987654", ""),
+    "common term + district": ("pothole", "AND district = 'district_37'"),
+    "common term + state": ("streetlight", "AND state = 'state_7'"),
+    "common term, no filter": ("pothole", ""),
+}
+
+
+def time_query(conn, q, extra, runs):
+    sql = "EXPLAIN (ANALYZE, FORMAT JSON) " + SEARCH.format(extra=extra)
+    timings = []
+    for _ in range(runs):
+        plan = conn.execute(text(sql), {"q": q}).scalar()
+        plan = plan if isinstance(plan, list) else json.loads(plan)
+        timings.append(plan[0]["Execution Time"])
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    index_migration = next(module for version, _, module in load_migrations() if version == "0005")
+
+    with scratch_schema(SCHEMA, args.rows) as conn:
+        for statement in index_migration.upgrade:
+            conn.execute(text(statement))
+        conn.execute(text("ANALYZE issues"))
+
+        print(f"{args.rows} rows, median of {args.runs} runs")
+        for name, (q, extra) in QUERIES.items():
+            elapsed = time_query(conn, q, extra, args.runs)
+            verdict = "ok" if elapsed < BUDGET_MS else "over budget"
+            print(f"{name:<26} {elapsed:9.2f} ms  {verdict}")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,8 +16,16 @@ from routers.get_desc_from_db import router as get_desc_from_db_router
 from routers.get_top_search import router as get_top_search_router
 from routers.admin_routes.user_management import router as admin_router
 from routers.admin_routes.department_management import router as department_router
+from routers.health import router as health_router
+from routers.locations import router as locations_router
+from routers.feed import router as feed_router
 
 from utils.mdb import init_indexes
+from services.issues.engagement_services import ensure_issue_stats_backfilled
+from services.issues.view_buffer import view_buffer
+from services.trending import trending_engine
+from services.leaderboards import leaderboard_refresher
+from services.locations import location_directory
 
 app = FastAPI()
 
@@ -37,6 +45,21 @@ def read_root():
 @app.on_event("startup")
 async def startup_db():
     await init_indexes()
+    # Counts are read from issue_stats only, so it must exist before traffic arrives
+    await ensure_issue_stats_backfilled()
+    view_buffer.start()
+    trending_engine.start()
+    leaderboard_refresher.start()
+    await location_directory.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_db():
+    await trending_engine.stop()
+    await leaderboard_refresher.stop()
+    await location_directory.stop()
+    # Persist views still held in memory before the worker exits
+    await view_buffer.stop()
     
 
 def test_db():
@@ -77,6 +100,9 @@ app.include_router(get_desc_from_db_router)
 app.include_router(get_top_search_router)
 app.include_router(admin_router)
 app.include_router(department_router)
+app.include_router(health_router)
+app.include_router(locations_router)
+app.include_router(feed_router)
 
 if __name__ == "__main__":
     import uvicorn
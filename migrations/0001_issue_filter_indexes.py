@@ -0,0 +1,41 @@
+"""
+Indexes for the /issues feed and batch filter access paths.
+
+Every feed query filters on is_deleted = false and orders by
+(created_at DESC, id DESC), so each index is partial on live rows and ends in
+the sort key. One index per filter column lets any single equality filter walk
+its index in feed order and stop after LIMIT rows; the planner picks the most
+selective one when several filters are combined.
+
+Built CONCURRENTLY so writes to issues are not blocked. If a build is
+interrupted, drop the INVALID index it leaves behind before re-running.
+"""
+
+transactional = False
+
+upgrade = [
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_issues_live_created "
+    "ON issues (created_at DESC, id DESC) WHERE is_deleted = false",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_issues_live_state_created "
+    "ON issues (state, created_at DESC, id DESC) WHERE is_deleted = false",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_issues_live_district_created "
+    "ON issues (district, created_at DESC, id DESC) WHERE is_deleted = false",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_issues_live_taluk_created "
+    "ON issues (taluk, created_at DESC, id DESC) WHERE is_deleted = false",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_issues_live_village_created "
+    "ON issues (village, created_at DESC, id DESC) WHERE is_deleted = false",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_issues_live_dept_created "
+    "ON issues (dept_id, created_at DESC, id DESC) WHERE is_deleted = false",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_issues_live_user_created "
+    "ON issues (user_id, created_at DESC, id DESC) WHERE is_deleted = false",
+]
+
+downgrade = [
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_issues_live_user_created",
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_issues_live_dept_created",
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_issues_live_village_created",
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_issues_live_taluk_created",
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_issues_live_district_created",
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_issues_live_state_created",
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_issues_live_created",
+]
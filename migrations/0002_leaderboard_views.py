@@ -0,0 +1,41 @@
+"""
+Materialized leaderboards for the /top and /bottom endpoints.
+
+Each view stores the ranking score as a plain column so the top and bottom of
+a leaderboard are read straight off a b-tree instead of sorting issue_depts,
+employees or issues on every request. The unique index on each view is what
+allows REFRESH MATERIALIZED VIEW CONCURRENTLY; services.leaderboards refreshes
+them on a schedule.
+"""
+
+upgrade = [
+    "CREATE MATERIALIZED VIEW IF NOT EXISTS dept_leaderboard AS "
+    "SELECT id AS dept_id, dept AS dept_name, location, category, "
+    "COALESCE(negative_count, 0) + COALESCE(positive_count, 0) AS score "
+    "FROM issue_depts",
+    "CREATE UNIQUE INDEX IF NOT EXISTS ux_dept_leaderboard_dept ON dept_leaderboard (dept_id)",
+    "CREATE INDEX IF NOT EXISTS ix_dept_leaderboard_score ON dept_leaderboard (score, dept_id)",
+
+    "CREATE MATERIALIZED VIEW IF NOT EXISTS official_leaderboard AS "
+    "SELECT id AS employee_id, fullname, role, state, district, "
+    "COALESCE(false_count, 0) + COALESCE(good_count, 0) AS score "
+    "FROM employees",
+    "CREATE UNIQUE INDEX IF NOT EXISTS ux_official_leaderboard_employee "
+    "ON official_leaderboard (employee_id)",
+    "CREATE INDEX IF NOT EXISTS ix_official_leaderboard_score "
+    "ON official_leaderboard (score, employee_id)",
+
+    "CREATE MATERIALIZED VIEW IF NOT EXISTS location_leaderboard AS "
+    "SELECT state, count(*) AS issue_count "
+    "FROM issues WHERE is_deleted = false AND state IS NOT NULL "
+    "GROUP BY state",
+    "CREATE UNIQUE INDEX IF NOT EXISTS ux_location_leaderboard_state ON location_leaderboard (state)",
+    "CREATE INDEX IF NOT EXISTS ix_location_leaderboard_count "
+    "ON location_leaderboard (issue_count, state)",
+]
+
+downgrade = [
+    "DROP MATERIALIZED VIEW IF EXISTS location_leaderboard",
+    "DROP MATERIALIZED VIEW IF EXISTS official_leaderboard",
+    "DROP MATERIALIZED VIEW IF EXISTS dept_leaderboard",
+]
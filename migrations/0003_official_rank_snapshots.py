@@ -0,0 +1,35 @@
+"""
+Snapshot table for rolling-window official rankings.
+
+services.official_rankings rebuilds one period ("week" or "month") at a time
+with RANK() window functions. The primary key makes a single official's rank a
+point lookup, and one index per ranking scope lets leaderboards seek straight
+to a (rank, employee_id) position.
+"""
+
+upgrade = [
+    "CREATE TABLE IF NOT EXISTS official_rank_snapshots ("
+    " period VARCHAR NOT NULL,"
+    " employee_id UUID NOT NULL REFERENCES employees (id) ON DELETE CASCADE,"
+    " fullname VARCHAR,"
+    " state VARCHAR,"
+    " district VARCHAR,"
+    " issue_count INTEGER NOT NULL,"
+    " resolved_count INTEGER NOT NULL,"
+    " score INTEGER NOT NULL,"
+    " overall_rank INTEGER NOT NULL,"
+    " state_rank INTEGER NOT NULL,"
+    " district_rank INTEGER NOT NULL,"
+    " computed_at TIMESTAMPTZ NOT NULL,"
+    " PRIMARY KEY (period, employee_id))",
+    "CREATE INDEX IF NOT EXISTS ix_official_rank_overall "
+    "ON official_rank_snapshots (period, overall_rank, employee_id)",
+    "CREATE INDEX IF NOT EXISTS ix_official_rank_state "
+    "ON official_rank_snapshots (period, state, state_rank, employee_id)",
+    "CREATE INDEX IF NOT EXISTS ix_official_rank_district "
+    "ON official_rank_snapshots (period, state, district, district_rank, employee_id)",
+]
+
+downgrade = [
+    "DROP TABLE IF EXISTS official_rank_snapshots",
+]
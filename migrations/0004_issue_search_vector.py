@@ -0,0 +1,18 @@
+"""
+Generated full-text search column on issues.
+
+Headlines are weighted above descriptions so ts_rank_cd prefers issues whose
+headline matches. Adding a stored generated column rewrites the table under an
+ACCESS EXCLUSIVE lock; run it in a quiet window on large installs. The GIN
+index is built separately in 0005 because it has to be CONCURRENTLY.
+"""
+
+upgrade = [
+    "ALTER TABLE issues ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('english', coalesce(issue_headline, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(issue_desc, '')), 'B')) STORED",
+]
+
+downgrade = [
+    "ALTER TABLE issues DROP COLUMN IF EXISTS search_vector",
+]
@@ -0,0 +1,17 @@
+"""
+GIN index for /issues/search, partial on live rows like the 0001 feed indexes.
+
+Built CONCURRENTLY so writes to issues are not blocked. If a build is
+interrupted, drop the INVALID index it leaves behind before re-running.
+"""
+
+transactional = False
+
+upgrade = [
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_issues_live_search "
+    "ON issues USING gin (search_vector) WHERE is_deleted = false",
+]
+
+downgrade = [
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_issues_live_search",
+]
@@ -0,0 +1,25 @@
+"""
+Indexes for paginated comments and lazy reply expansion.
+
+A page of top-level comments seeks (issue_id, is_reply = false) and walks
+(created_at DESC, id DESC); replies seek comment_id and walk (created_at, id)
+oldest first. Both are partial on live rows so each page is a bounded index
+scan that stops after LIMIT rows.
+
+Built CONCURRENTLY so writes to comments are not blocked. If a build is
+interrupted, drop the INVALID index it leaves behind before re-running.
+"""
+
+transactional = False
+
+upgrade = [
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_comments_live_issue_created "
+    "ON comments (issue_id, is_reply, created_at DESC, id DESC) WHERE is_deleted = false",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_comments_live_parent_created "
+    "ON comments (comment_id, created_at, id) WHERE is_deleted = false",
+]
+
+downgrade = [
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_comments_live_parent_created",
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_comments_live_issue_created",
+]
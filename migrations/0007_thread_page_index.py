@@ -0,0 +1,20 @@
+"""
+Index for keyset-paginated thread listing.
+
+Threads of an issue are paged newest first on (created_at DESC, id DESC); the
+index is partial on live rows so each page is a bounded index scan.
+
+Built CONCURRENTLY so writes to threads are not blocked. If a build is
+interrupted, drop the INVALID index it leaves behind before re-running.
+"""
+
+transactional = False
+
+upgrade = [
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_threads_live_issue_created "
+    "ON threads (issue_id, created_at DESC, id DESC) WHERE is_deleted = false",
+]
+
+downgrade = [
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_threads_live_issue_created",
+]
@@ -0,0 +1,21 @@
+"""
+Index for the paginated /save listing.
+
+The saves primary key leads with issue_id, so listing one user's saves had to
+scan the table. This index seeks user_id and walks (created_at DESC,
+issue_id DESC) in page order.
+
+Built CONCURRENTLY so writes to saves are not blocked. If a build is
+interrupted, drop the INVALID index it leaves behind before re-running.
+"""
+
+transactional = False
+
+upgrade = [
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_saves_user_created "
+    "ON saves (user_id, created_at DESC, issue_id DESC)",
+]
+
+downgrade = [
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_saves_user_created",
+]
@@ -0,0 +1,60 @@
+"""
+Normalized follow graph replacing the following_* JSON arrays on profile.
+
+One row per (follower, target) edge. The primary key answers "does X follow
+Y" and follow/unfollow; ix_follows_following pages what a user follows and
+ix_follows_followers pages who follows a target, both newest first.
+
+Existing JSON arrays are copied in once. Elements may be plain strings or
+objects carrying an "id"; anything else is skipped. IDs are stored in the same
+canonical form services/profile.py writes (lowercase, hyphenated UUID text;
+locations with whitespace collapsed), so legacy follows can be unfollowed and
+joined against issue columns. IDs that are not UUIDs are skipped rather than
+copied. The JSON columns are left in place for rollback and still hold any
+skipped entries, but are no longer read or written.
+"""
+
+_UUID_BODY = "[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}"
+# Spellings Postgres accepts as uuid input, so the guarded cast below cannot fail
+_UUID_PATTERN = "^(\\{" + _UUID_BODY + "\\}|" + _UUID_BODY + ")$"
+
+_CANONICAL_UUID = (
+    "CASE WHEN btrim(target.id) ~ '" + _UUID_PATTERN + "' THEN btrim(target.id)::uuid::text END"
+)
+_CANONICAL_LOCATION = "nullif(regexp_replace(btrim(target.id), '\\s+', ' ', 'g'), '')"
+
+_BACKFILL = (
+    "INSERT INTO follows (follower_id, target_type, target_id, created_at) "
+    "SELECT p.user_id, '{target_type}', canonical.id, now() "
+    "FROM profile p "
+    "CROSS JOIN LATERAL json_array_elements("
+    " CASE WHEN json_typeof(p.{column}) = 'array' THEN p.{column} ELSE '[]'::json END) AS element "
+    "CROSS JOIN LATERAL (SELECT CASE json_typeof(element) "
+    " WHEN 'string' THEN element #>> '{{}}' "
+    " WHEN 'object' THEN element ->> 'id' END AS id) AS target "
+    "CROSS JOIN LATERAL (SELECT {canonical} AS id) AS canonical "
+    "WHERE p.user_id IS NOT NULL AND canonical.id IS NOT NULL "
+    "ON CONFLICT DO NOTHING"
+)
+
+upgrade = [
+    "CREATE TABLE IF NOT EXISTS follows ("
+    " follower_id UUID NOT NULL REFERENCES users (id) ON DELETE CASCADE,"
+    " target_type VARCHAR NOT NULL,"
+    " target_id VARCHAR NOT NULL,"
+    " created_at TIMESTAMPTZ NOT NULL DEFAULT now(),"
+    " PRIMARY KEY (follower_id, target_type, target_id))",
+    "CREATE INDEX IF NOT EXISTS ix_follows_following "
+    "ON follows (follower_id, target_type, created_at, target_id)",
+    "CREATE INDEX IF NOT EXISTS ix_follows_followers "
+    "ON follows (target_type, target_id, created_at, follower_id)",
+    _BACKFILL.format(target_type="user", column="following_users", canonical=_CANONICAL_UUID),
+    _BACKFILL.format(target_type="issue", column="following_issues", canonical=_CANONICAL_UUID),
+    _BACKFILL.format(target_type="dept", column="following_depts", canonical=_CANONICAL_UUID),
+    _BACKFILL.format(
+        target_type="location", column="following_locations", canonical=_CANONICAL_LOCATION),
+]
+
+downgrade = [
+    "DROP TABLE IF EXISTS follows",
+]
@@ -0,0 +1,20 @@
+"""
+Make issues.created_at NOT NULL so keyset paging never meets a NULL sort key.
+
+Rows inserted before create_issue_in_db stamped created_at server-side have
+NULL there: ORDER BY created_at DESC lists them first, the (created_at, id)
+seek drops them from every later page, and a page ending on one cannot be
+turned into a cursor. They are backfilled from issue_time, or the migration
+time when that is missing too, and the column gets a now() default.
+"""
+
+upgrade = [
+    "UPDATE issues SET created_at = coalesce(issue_time, now()) WHERE created_at IS NULL",
+    "ALTER TABLE issues ALTER COLUMN created_at SET DEFAULT now()",
+    "ALTER TABLE issues ALTER COLUMN created_at SET NOT NULL",
+]
+
+downgrade = [
+    "ALTER TABLE issues ALTER COLUMN created_at DROP NOT NULL",
+    "ALTER TABLE issues ALTER COLUMN created_at DROP DEFAULT",
+]
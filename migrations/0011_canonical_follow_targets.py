@@ -0,0 +1,37 @@
+"""
+Canonicalize follows.target_id rows copied by an earlier 0009 backfill.
+
+That backfill copied legacy JSON entries verbatim, so uppercase, braced or
+unhyphenated UUIDs could never match an unfollow, and malformed ones made the
+following feed's uuid cast fail. Rows are rewritten to the form
+services/profile.py writes (lowercase, hyphenated UUID text; locations with
+whitespace collapsed). Rows that cannot be canonicalized are deleted; the
+profile JSON columns still hold the original entries.
+"""
+
+_UUID_BODY = "[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}"
+# Spellings Postgres accepts as uuid input, so the guarded cast below cannot fail
+_UUID_PATTERN = "^(\\{" + _UUID_BODY + "\\}|" + _UUID_BODY + ")$"
+
+_CANONICAL = (
+    "CASE WHEN follows.target_type = 'location' "
+    " THEN nullif(regexp_replace(btrim(follows.target_id), '\\s+', ' ', 'g'), '') "
+    "WHEN follows.target_type IN ('user', 'issue', 'dept') "
+    " AND btrim(follows.target_id) ~ '" + _UUID_PATTERN + "' "
+    " THEN btrim(follows.target_id)::uuid::text END"
+)
+
+upgrade = [
+    # Copy each non-canonical edge under its canonical ID, keeping when it was followed
+    "INSERT INTO follows (follower_id, target_type, target_id, created_at) "
+    "SELECT follows.follower_id, follows.target_type, canonical.id, follows.created_at "
+    "FROM follows "
+    "CROSS JOIN LATERAL (SELECT " + _CANONICAL + " AS id) AS canonical "
+    "WHERE canonical.id IS NOT NULL AND canonical.id <> follows.target_id "
+    "ON CONFLICT DO NOTHING",
+    # Then drop the originals along with anything that has no canonical form
+    "DELETE FROM follows WHERE (" + _CANONICAL + ") IS DISTINCT FROM follows.target_id",
+]
+
+# The rewritten spellings are not kept, so there is nothing to restore
+downgrade = []
@@ -7,6 +7,7 @@ from .comment import Comment
 from .employee import Employee
 from .issue_depts import IssueDept
 from .issue_types import IssueType
+from .follow import Follow
 from sqlalchemy.orm import relationship
 
 User.profile = relationship("Profile", back_populates="user")
@@ -27,5 +28,6 @@ __all__ = [
     "Comment",
     "Employee",
     "IssueDept",
-    "IssueType"
+    "IssueType",
+    "Follow"
 ]
\ No newline at end of file
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, ForeignKey, Index, String, TIMESTAMP, func
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+
+from models.base import Base
+
+# target_id holds a user, issue or dept UUID as text, or a location name
+FOLLOW_TARGET_TYPES = ("user", "issue", "dept", "location")
+# Canonical target_id for user, issue and dept follows: str(uuid.UUID(...))
+FOLLOW_UUID_PATTERN = "^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
+
+class Follow(Base):
+    __tablename__ = "follows"
+    follower_id = Column(PG_UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    target_type = Column(String, primary_key=True)
+    target_id = Column(String, primary_key=True)
+    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_follows_following", "follower_id", "target_type", "created_at", "target_id"),
+        Index("ix_follows_followers", "target_type", "target_id", "created_at", "follower_id"),
+    )
@@ -1,7 +1,7 @@
-from sqlalchemy import Column, String, TIMESTAMP, Boolean, ForeignKey, JSON
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy import Column, Computed, String, TIMESTAMP, Boolean, ForeignKey, JSON, func
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID as PG_UUID
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from models.base import Base
 import uuid
 
@@ -23,10 +23,15 @@ class Issue(Base):
     issue_time = Column(TIMESTAMP(timezone=True))
     is_anonymous = Column(Boolean)
     evidence_url = Column(JSON, nullable=True)
-    created_at = Column(TIMESTAMP(timezone=True))
+    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
     priority = Column(String, nullable=False)
     is_edited = Column(Boolean, default=False)
     is_deleted = Column(Boolean, default=False)
+    # Maintained by Postgres (migration 0004); deferred so feed reads never load it
+    search_vector = deferred(Column(TSVECTOR, Computed(
+        "setweight(to_tsvector('english', coalesce(issue_headline, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(issue_desc, '')), 'B')",
+        persisted=True)))
 
     user = relationship("User", back_populates="issues")
     employee = relationship("Employee", back_populates="issues")
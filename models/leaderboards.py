@@ -0,0 +1,33 @@
+from sqlalchemy import BigInteger, Column, Integer, MetaData, String, Table
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+
+# Materialized views created by migrations/0002_leaderboard_views.py. They live
+# on their own MetaData so Base.metadata.create_all never creates them as tables.
+leaderboard_metadata = MetaData()
+
+dept_leaderboard = Table(
+    "dept_leaderboard", leaderboard_metadata,
+    Column("dept_id", PG_UUID(as_uuid=True), primary_key=True),
+    Column("dept_name", String),
+    Column("location", String),
+    Column("category", String),
+    Column("score", Integer),
+)
+
+official_leaderboard = Table(
+    "official_leaderboard", leaderboard_metadata,
+    Column("employee_id", PG_UUID(as_uuid=True), primary_key=True),
+    Column("fullname", String),
+    Column("role", String),
+    Column("state", String),
+    Column("district", String),
+    Column("score", Integer),
+)
+
+location_leaderboard = Table(
+    "location_leaderboard", leaderboard_metadata,
+    Column("state", String, primary_key=True),
+    Column("issue_count", BigInteger),
+)
+
+LEADERBOARD_VIEWS = (dept_leaderboard, official_leaderboard, location_leaderboard)
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, TIMESTAMP
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+
+from models.base import Base
+
+class OfficialRankSnapshot(Base):
+    __tablename__ = "official_rank_snapshots"
+    period = Column(String, primary_key=True)
+    employee_id = Column(PG_UUID(as_uuid=True), ForeignKey("employees.id", ondelete="CASCADE"), primary_key=True)
+    fullname = Column(String)
+    state = Column(String)
+    district = Column(String)
+    issue_count = Column(Integer, nullable=False)
+    resolved_count = Column(Integer, nullable=False)
+    score = Column(Integer, nullable=False)
+    overall_rank = Column(Integer, nullable=False)
+    state_rank = Column(Integer, nullable=False)
+    district_rank = Column(Integer, nullable=False)
+    computed_at = Column(TIMESTAMP(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index("ix_official_rank_overall", "period", "overall_rank", "employee_id"),
+        Index("ix_official_rank_state", "period", "state", "state_rank", "employee_id"),
+        Index("ix_official_rank_district", "period", "state", "district", "district_rank", "employee_id"),
+    )
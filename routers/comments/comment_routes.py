@@ -1,12 +1,15 @@
 import datetime
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from schemas.comment import CommentCreate, CommentUpdate
-from utils.db import get_db
+from utils.db import get_async_db
 from utils.jwt_guard import get_current_user
 from services.comments.comment_services import (
+    COMMENT_PAGE_SIZE,
     fetch_comments_by_issue_id,
+    fetch_comment_replies,
     create_comment_in_db,
     update_comment_in_db,
     delete_comment_in_db  
@@ -15,50 +18,78 @@ from services.comments.comment_services import (
 router = APIRouter(prefix="/comments", tags=["comments"])
 
 @router.get("/{issue_id}")
-async def get_comments(issue_id: str, db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+async def get_comments(
+    issue_id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(COMMENT_PAGE_SIZE, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user)
+):
     try:
         user_id = current_user.get("sub")
         if not user_id:
             raise HTTPException(
                 status_code=401, detail="User not authenticated.")
-        return await fetch_comments_by_issue_id(issue_id, db)
+        return await fetch_comments_by_issue_id(issue_id, db, user_id, cursor, limit)
+    except HTTPException:
+        raise
     except Exception:
         raise HTTPException(
             status_code=500, detail="Failed to fetch comments. Please try again later.")
+
+@router.get("/{comment_id}/replies")
+async def get_comment_replies(
+    comment_id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(COMMENT_PAGE_SIZE, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user)
+):
+    try:
+        user_id = current_user.get("sub")
+        if not user_id:
+            raise HTTPException(
+                status_code=401, detail="User not authenticated.")
+        return await fetch_comment_replies(comment_id, db, user_id, cursor, limit)
+    except HTTPException:
+        raise
+    except Exception:
+        raise HTTPException(
+            status_code=500, detail="Failed to fetch replies. Please try again later.")
         
 @router.post("/")
-def create_comment(comment_data: CommentCreate, db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+async def create_comment(comment_data: CommentCreate, db: AsyncSession = Depends(get_async_db), current_user: dict = Depends(get_current_user)):
     try:
         user_id = current_user.get("sub")
         if not user_id:
             raise HTTPException(
                 status_code=401, detail="User not authenticated.")
-        return create_comment_in_db(comment_data, user_id, db)
+        return await create_comment_in_db(comment_data, user_id, db)
     except Exception:
         raise HTTPException(
             status_code=500, detail="Failed to create comment. Please try again later.")
         
 @router.put("/{comment_id}")
-def update_comment(comment_id: str, comment_data: CommentUpdate, db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+async def update_comment(comment_id: str, comment_data: CommentUpdate, db: AsyncSession = Depends(get_async_db), current_user: dict = Depends(get_current_user)):
     try:
         user_id = current_user.get("sub")
         if not user_id:
             raise HTTPException(
                 status_code=401, detail="User not authenticated.")
             
-        return update_comment_in_db(comment_id, comment_data, user_id, db)
+        return await update_comment_in_db(comment_id, comment_data, user_id, db)
     except Exception:
         raise HTTPException(
             status_code=500, detail="Failed to update comment. Please try again later.")
         
 @router.delete("/{comment_id}")
-def delete_comment(comment_id: str, db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+async def delete_comment(comment_id: str, db: AsyncSession = Depends(get_async_db), current_user: dict = Depends(get_current_user)):
     try:
         user_id = current_user.get("sub")
         if not user_id:
             raise HTTPException(
                 status_code=401, detail="User not authenticated.")
-        return delete_comment_in_db(comment_id, user_id, db)
+        return await delete_comment_in_db(comment_id, user_id, db)
     except Exception:
         raise HTTPException(
             status_code=500, detail="Failed to delete comment. Please try again later.")    
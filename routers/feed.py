@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from utils.db import get_async_db
+from utils.jwt_guard import get_current_user
+from services.feed import FEED_PAGE_SIZE, get_following_feed
+
+router = APIRouter(prefix="/feed", tags=["feed"])
+
+
+@router.get("/following")
+async def following_feed(
+    limit: int = Query(FEED_PAGE_SIZE, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
+):
+    user_id = current_user.get("sub")
+    if not user_id:
+        raise HTTPException(status_code=401, detail="User not authenticated.")
+    try:
+        return await get_following_feed(db, user_id, cursor, limit)
+    except HTTPException:
+        raise
+    except Exception:
+        raise HTTPException(
+            status_code=500, detail="Failed to fetch following feed. Please try again later.")
@@ -1,9 +1,14 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from fastapi import Depends
+import uuid
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from utils.db import get_db
+from typing import Optional
+from utils.db import get_async_db, get_db
 from utils.jwt_guard import get_current_user
 from services.get_top_Searches_from_db import get_top_searches_from_db, get_top_departments_from_db, get_top_officials_from_db
+from services.official_rankings import get_official_leaderboard, get_official_rank
+from services.trending import TRENDING_TOP_K, trending_engine
 
 router = APIRouter(prefix="/top", tags=["search"])
 
@@ -42,4 +47,40 @@ def get_top_officials(db: Session = Depends(get_db), current_user: dict = Depend
         return get_top_officials_from_db(db)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch top officials: {str(e)}")
-    
\ No newline at end of file
+
+@router.get("/trending")
+def get_trending_issues(
+    state: Optional[str] = Query(None),
+    district: Optional[str] = Query(None),
+    limit: int = Query(10, ge=1, le=TRENDING_TOP_K),
+    current_user: dict = Depends(get_current_user)
+):
+    if district and not state:
+        raise HTTPException(status_code=400, detail="district requires state.")
+    return {
+        "state": state,
+        "district": district,
+        "refreshed_at": trending_engine.refreshed_at,
+        "issues": trending_engine.top(state, district, limit),
+    }
+
+@router.get("/officials/{period}")
+async def get_official_rankings(
+    period: str,
+    state: Optional[str] = Query(None),
+    district: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user)
+):
+    return await get_official_leaderboard(db, period, cursor, limit, state, district)
+
+@router.get("/officials/{period}/{employee_id}")
+async def get_official_ranking(
+    period: str,
+    employee_id: uuid.UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user)
+):
+    return await get_official_rank(db, employee_id, period)
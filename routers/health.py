@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends, HTTPException
+from services.issues.view_buffer import view_buffer
+from utils import mdb
+from utils.db import async_engine, engine
+from utils.jwt_guard import get_current_user
+from utils.pool_metrics import sql_pool_snapshot
+
+router = APIRouter(prefix="/health", tags=["health"])
+
+
+@router.get("/pools")
+def get_pool_metrics(current_user: dict = Depends(get_current_user)):
+    if current_user.get("role") != "admin":
+        raise HTTPException(status_code=403, detail="Not authorized.")
+    return {
+        "postgres": {
+            "sync": sql_pool_snapshot(engine.pool),
+            "async": sql_pool_snapshot(async_engine.pool),
+        },
+        "mongo": mdb.pool_listener.snapshot(mdb.MONGO_MAX_POOL_SIZE, mdb.MONGO_MIN_POOL_SIZE),
+    }
+
+
+@router.get("/view-buffer")
+def get_view_buffer_metrics(current_user: dict = Depends(get_current_user)):
+    if current_user.get("role") != "admin":
+        raise HTTPException(status_code=403, detail="Not authorized.")
+    return view_buffer.snapshot()
@@ -1,14 +1,19 @@
 import datetime
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.issue_depts import IssueDept
 from schemas.issue import IssueCreate, IssueUpdate, IssueBatchFilterRequest
 from typing import Optional
 from utils.access_control import require_creator_or_admin
-from utils.db import get_db
-from services.issues.issue_services import delete_issue_by_id, get_latest_issues, create_issue_in_db, get_latest_issues_admin, update_issue_in_db, get_issue_by_id, get_issues_by_batch_filters
-from utils.jwt_guard import get_current_user
-from utils.mdb import issue_likes, issue_shares, issue_supports, issue_views
+from utils.db import get_async_db
+from services.issues.issue_services import delete_issue_by_id, get_latest_issues, create_issue_in_db, get_latest_issues_admin, update_issue_in_db, get_issue_by_id, get_issue_owner_id, get_issues_by_batch_filters, \
+    stream_issues_by_batch_filters, search_issues, get_issue_facets
+from services.issues.engagement_services import load_issue_engagement, record_engagement, sum_engagement_window
+from services.issues.view_buffer import view_buffer
+from utils.jwt_guard import get_current_user, get_optional_user
+from utils.mdb import HOURLY_BUCKET_RETENTION_DAYS, issue_likes, issue_shares, issue_supports
 
 router = APIRouter(prefix="/issues", tags=["issues"])
 
@@ -23,7 +28,7 @@ async def get_issues(
     area: Optional[str] = None,
     issue_type: Optional[str] = None,
     department: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_user),
 ):
     try:
@@ -49,13 +54,61 @@ async def get_issues(
             department=department,
             user_id = user_id
         )
+    except HTTPException:
+        raise
     except Exception:
         raise HTTPException(
             status_code=500, detail="Failed to fetch issues. Please try again later."
         )
         
+@router.get("/search")
+async def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = None,
+    state: Optional[str] = None,
+    district: Optional[str] = None,
+    taluk: Optional[str] = None,
+    area: Optional[str] = None,
+    issue_type: Optional[str] = None,
+    department: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
+):
+    try:
+        return await search_issues(
+            db, q, cursor, limit, current_user.get("sub"),
+            state=state, district=district, taluk=taluk, area=area,
+            issue_type=issue_type, department=department)
+    except HTTPException:
+        raise
+    except Exception:
+        raise HTTPException(
+            status_code=500, detail="Failed to search issues. Please try again later.")
+
+@router.get("/facets")
+async def get_facets(
+    state: Optional[str] = None,
+    district: Optional[str] = None,
+    taluk: Optional[str] = None,
+    area: Optional[str] = None,
+    issue_type: Optional[str] = None,
+    department: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
+):
+    try:
+        return await get_issue_facets(
+            db, state=state, district=district, taluk=taluk, area=area,
+            issue_type=issue_type, department=department)
+    except HTTPException:
+        raise
+    except Exception:
+        raise HTTPException(
+            status_code=500, detail="Failed to fetch issue facets. Please try again later.")
+
 @router.get("/{issue_id}")
-async def get_issue(issue_id: str, db: Session = Depends(get_db)):
+async def get_issue(issue_id: str, db: AsyncSession = Depends(get_async_db)):
     try:
         return await get_issue_by_id(issue_id, db)
     except Exception:
@@ -63,7 +116,7 @@ async def get_issue(issue_id: str, db: Session = Depends(get_db)):
             status_code=500, detail="Failed to fetch issue. Please try again later.")
         
 @router.get("/admin&page={page}")
-async def get_issues_admin(page: int = 1, limit: int = 10, db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+async def get_issues_admin(page: int = 1, limit: int = 10, db: AsyncSession = Depends(get_async_db), current_user: dict = Depends(get_current_user)):
     try:
         if page < 1:
             raise HTTPException(status_code=400, detail="Invalid page number.")
@@ -75,14 +128,14 @@ async def get_issues_admin(page: int = 1, limit: int = 10, db: Session = Depends
             status_code=500, detail="Failed to fetch issues. Please try again later.")
 
 @router.post("")
-def create_issue(issue_data: IssueCreate, db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+async def create_issue(issue_data: IssueCreate, db: AsyncSession = Depends(get_async_db), current_user: dict = Depends(get_current_user)):
     try:
         user_id = current_user.get("sub")
         if not user_id:
             raise HTTPException(
                 status_code=401, detail="User not authenticated.")
         
-        return create_issue_in_db(issue_data, db, user_id)
+        return await create_issue_in_db(issue_data, db, user_id)
     except HTTPException as e:
         raise e
     except Exception:
@@ -91,7 +144,7 @@ def create_issue(issue_data: IssueCreate, db: Session = Depends(get_db), current
 
 
 @router.put("/{issue_id}")
-async def update_issue(issue_id: str, issue_data: IssueUpdate, db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+async def update_issue(issue_id: str, issue_data: IssueUpdate, db: AsyncSession = Depends(get_async_db), current_user: dict = Depends(get_current_user)):
     try:
         user_id = current_user.get("sub")
         if not user_id:
@@ -100,15 +153,12 @@ async def update_issue(issue_id: str, issue_data: IssueUpdate, db: Session = Dep
             
         issue_data.is_edited = True  # Ensure is_edited is set to True on update
         
-        issue = await get_issue_by_id(issue_id, db)
-        issue = issue["issue"]
-        if not issue:
-            raise HTTPException(status_code=404, detail="Issue not found.")
+        owner_id = await get_issue_owner_id(issue_id, db)
 
         # Ensure access control (creator or admin)
-        require_creator_or_admin(str(issue.user_id))(current_user)
+        require_creator_or_admin(owner_id)(current_user)
                         
-        return update_issue_in_db(issue_id, issue_data, db, str(issue.user_id))
+        return await update_issue_in_db(issue_id, issue_data, db, owner_id)
 
     except HTTPException as e:
         import logging
@@ -123,21 +173,19 @@ async def update_issue(issue_id: str, issue_data: IssueUpdate, db: Session = Dep
 
 
 @router.delete("/{issue_id}")
-async def delete_issue(issue_id: str, db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+async def delete_issue(issue_id: str, db: AsyncSession = Depends(get_async_db), current_user: dict = Depends(get_current_user)):
     try:
         user_id = current_user.get("sub")
         if not user_id:
             raise HTTPException(
                 status_code=401, detail="User not authenticated.")
             
-        issue = await get_issue_by_id(issue_id, db)
-        if not issue:
-            raise HTTPException(status_code=404, detail="Issue not found.")
+        owner_id = await get_issue_owner_id(issue_id, db)
 
         # Ensure access control (creator or admin)
-        require_creator_or_admin(str(issue.user_id))(current_user)
+        require_creator_or_admin(owner_id)(current_user)
         
-        return delete_issue_by_id(issue_id, str(issue.user_id), db)
+        return await delete_issue_by_id(issue_id, owner_id, db)
     except HTTPException as e:
         raise e
     except Exception:
@@ -145,9 +193,9 @@ async def delete_issue(issue_id: str, db: Session = Depends(get_db), current_use
             status_code=500, detail="Failed to delete issue. Please try again later.")
        
 @router.get("/alldepts")
-def get_all_departments(db: Session = Depends(get_db)):
+async def get_all_departments(db: AsyncSession = Depends(get_async_db)):
     try:
-        departments = db.query(IssueDept).all()
+        departments = (await db.execute(select(IssueDept))).scalars().all()
         
         result = []
         
@@ -166,13 +214,12 @@ async def like_issue(issue_id: str, current_user: dict = Depends(get_current_use
     try:
         user_id = current_user.get("sub")
         
-        if issue_likes.find_one({"issue_id": issue_id, "user_id": user_id}):
-            await issue_likes.delete_one({"issue_id": issue_id, "user_id": user_id})
-        await issue_likes.insert_one({
-            "issue_id": issue_id,
-            "user_id": user_id,
-            "created_at": datetime.datetime.utcnow()
-        })
+        liked = await issue_likes.update_one(
+            {"issue_id": issue_id, "user_id": user_id},
+            {"$setOnInsert": {"created_at": datetime.datetime.utcnow()}},
+            upsert=True)
+        if liked.upserted_id is not None:
+            await record_engagement(issue_id, "likes", 1)
     except Exception as e:
         import logging
         logging.exception("Error liking issue %s: %s", issue_id, str(e))
@@ -186,7 +233,9 @@ async def support_issue(issue_id: str, current_user: dict = Depends(get_current_
         
         found = await issue_supports.find_one({"issue_id": issue_id, "user_id": user_id})
         if found:
-            await issue_supports.delete_one({"issue_id": issue_id, "user_id": user_id})
+            removed = await issue_supports.delete_one({"issue_id": issue_id, "user_id": user_id})
+            if removed.deleted_count:
+                await record_engagement(issue_id, "supports", -1)
             return {"message": "Unsupported"}
         
         await issue_supports.insert_one({
@@ -194,6 +243,7 @@ async def support_issue(issue_id: str, current_user: dict = Depends(get_current_
             "user_id": user_id,
             "created_at": datetime.datetime.utcnow()
         })
+        await record_engagement(issue_id, "supports", 1)
     except Exception:
         raise HTTPException(400, "Already supported")
     return {"message": "Supported"}
@@ -208,17 +258,20 @@ async def share_issue(issue_id: str, platform: str, current_user: dict = Depends
             "platform": platform,
             "created_at": datetime.datetime.utcnow()
         })
+        await record_engagement(issue_id, "shares", 1)
     except Exception:
         raise HTTPException(400, "Already shared")
     return {"message": "Shared"}
 
 
 @router.post("/{issue_id}/view")
-async def increment_view(issue_id: str):
+async def increment_view(issue_id: str, request: Request, current_user: Optional[dict] = Depends(get_optional_user)):
     try:
-        await issue_views.update_one({"issue_id": issue_id},
-                                    {"$inc": {"views": 1}},
-                                    upsert=True)
+        # Anonymous viewers are told apart by client address for the unique-viewer estimate
+        viewer = current_user.get("sub") if current_user else None
+        if not viewer and request.client:
+            viewer = f"ip:{request.client.host}"
+        view_buffer.add(issue_id, viewer)
         return {"message": "View count incremented"}
     except Exception as e:
         import logging
@@ -228,18 +281,16 @@ async def increment_view(issue_id: str):
 
 @router.get("/{issue_id}/views")
 async def get_issue_with_views(issue_id: str):
-    issue = await issue_views.find_one({"issue_id": issue_id})
-    if not issue:
-        raise HTTPException(404, detail="Issue not found")
+    counts = (await load_issue_engagement([issue_id]))[issue_id]
     return {
-        "issue_id": str(issue["issue_id"]),
-        "views": issue.get("views", 0)
+        "issue_id": issue_id,
+        "views": counts["views"]
     }
 
 @router.get("/{issue_id}/likes")
 async def get_issue_likes(issue_id: str):
     try:
-        likes = await issue_likes.count_documents({"issue_id": issue_id})
+        likes = (await load_issue_engagement([issue_id]))[issue_id]["likes"]
         return {"likes": likes, "issue_id": issue_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail="Failed to fetch likes: " + str(e))
@@ -247,7 +298,7 @@ async def get_issue_likes(issue_id: str):
 @router.get("/{issue_id}/supports")
 async def get_issue_supports(issue_id: str):
     try:
-        supports = await issue_supports.count_documents({"issue_id": issue_id})
+        supports = (await load_issue_engagement([issue_id]))[issue_id]["supports"]
         return {"supports": supports, "issue_id": issue_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail="Failed to fetch supports: " + str(e))
@@ -255,20 +306,29 @@ async def get_issue_supports(issue_id: str):
 @router.get("/{issue_id}/shares")
 async def get_issue_shares(issue_id: str):
     try:
-        shares = await issue_shares.count_documents({"issue_id": issue_id})
+        shares = (await load_issue_engagement([issue_id]))[issue_id]["shares"]
         return {"issue_id": issue_id, "platforms": await issue_shares.distinct("platform", {"issue_id": issue_id}), "total_shares": shares}
     except Exception as e:
         raise HTTPException(status_code=500, detail="Failed to fetch shares: " + str(e))
 
+@router.get("/{issue_id}/engagement")
+async def get_issue_engagement_window(issue_id: str, hours: int = Query(24, ge=1, le=HOURLY_BUCKET_RETENTION_DAYS * 24)):
+    try:
+        counts = (await sum_engagement_window([issue_id], hours))[issue_id]
+        return {"issue_id": issue_id, "hours": hours, **counts}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Failed to fetch engagement: " + str(e))
+
 @router.post("/batch_filter")
 async def batch_filter_issues(
     filters: IssueBatchFilterRequest,
-    db: Session = Depends(get_db),
+    request: Request,
+    stream: bool = Query(False),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_user),
 ):
     try:
-        return await get_issues_by_batch_filters(
-            db=db,
+        criteria = dict(
             user_ids=[str(uid) for uid in filters.user_ids] if filters.user_ids else None,
             dept_ids=[str(did) for did in filters.dept_ids] if filters.dept_ids else None,
             issue_ids=[str(iid) for iid in filters.issue_ids] if filters.issue_ids else None,
@@ -277,5 +337,10 @@ async def batch_filter_issues(
             taluks=filters.taluks,
             villages=filters.villages,
         )
+        viewer_id = current_user.get("sub")
+        if stream or "application/x-ndjson" in request.headers.get("accept", ""):
+            return StreamingResponse(
+                stream_issues_by_batch_filters(viewer_id, **criteria), media_type="application/x-ndjson")
+        return await get_issues_by_batch_filters(db=db, viewer_id=viewer_id, **criteria)
     except Exception:
         raise HTTPException(status_code=500, detail="Failed to batch filter issues. Please try again later.")
\ No newline at end of file
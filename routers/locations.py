@@ -0,0 +1,30 @@
+from fastapi import APIRouter, HTTPException, Query
+from typing import Optional
+from services.locations import location_directory
+from utils.location_index import LOCATION_LEVELS
+
+router = APIRouter(prefix="/locations", tags=["locations"])
+
+
+@router.get("/autocomplete")
+def autocomplete_locations(
+    level: str = Query(...),
+    q: str = Query("", max_length=100),
+    state: Optional[str] = None,
+    district: Optional[str] = None,
+    taluk: Optional[str] = None,
+    limit: int = Query(10, ge=1, le=50),
+):
+    if level not in LOCATION_LEVELS:
+        raise HTTPException(status_code=400, detail="Unknown location level.")
+
+    # Only ancestors of the requested level narrow the search, and they cannot skip a level
+    ancestors = (state, district, taluk)[:LOCATION_LEVELS.index(level)]
+    scope = tuple(value for value in ancestors if value)
+    if any(not value for value in ancestors[:len(scope)]):
+        raise HTTPException(status_code=400, detail="Location scope must start at state and not skip levels.")
+
+    return {
+        "level": level,
+        "suggestions": location_directory.index.suggest(level, q, scope, limit),
+    }
@@ -1,13 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from psycopg2 import DatabaseError
 
 from schemas.profile import ProfileCreate, ProfileUpdate
 from services.profile import add_following_user, get_following_service, get_profile_service, \
     onboard_service, update_profile_service, add_following_issue, add_following_dept, add_following_location, \
-    remove_following_dept, remove_following_issue, remove_following_user, remove_following_location
+    remove_following_dept, remove_following_issue, remove_following_user, remove_following_location, \
+    list_following_service, list_followers_service, FOLLOW_PAGE_SIZE
 from utils.access_control import require_creator_or_admin
 from utils.db import get_db
 from utils.jwt_guard import get_current_user
+from typing import Optional
 
 router = APIRouter(prefix="/profile", tags=["onboarding"])
 
@@ -91,6 +93,75 @@ def get_following(
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error: " + str(e))
     
+@router.get('/following/{target_type}')
+def get_following_page(
+    target_type: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(FOLLOW_PAGE_SIZE, ge=1, le=100),
+    get_current_user=Depends(get_current_user),
+    db=Depends(get_db)
+):
+    try:
+        user_id = get_current_user.get("sub")
+        if not user_id:
+            raise HTTPException(status_code=401, detail="Unauthorized")
+        
+        return list_following_service(user_id, target_type, db, cursor, limit)
+    
+    except HTTPException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+    except DatabaseError as e:
+        raise HTTPException(status_code=500, detail="Database error: " + str(e))
+    
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Internal server error: " + str(e))
+    
+@router.get('/followers')
+def get_my_followers(
+    cursor: Optional[str] = None,
+    limit: int = Query(FOLLOW_PAGE_SIZE, ge=1, le=100),
+    get_current_user=Depends(get_current_user),
+    db=Depends(get_db)
+):
+    try:
+        user_id = get_current_user.get("sub")
+        if not user_id:
+            raise HTTPException(status_code=401, detail="Unauthorized")
+        
+        return list_followers_service("user", user_id, db, cursor, limit)
+    
+    except HTTPException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+    except DatabaseError as e:
+        raise HTTPException(status_code=500, detail="Database error: " + str(e))
+    
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Internal server error: " + str(e))
+    
+@router.get('/followers/{target_type}/{target_id}')
+def get_target_followers(
+    target_type: str,
+    target_id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(FOLLOW_PAGE_SIZE, ge=1, le=100),
+    get_current_user=Depends(get_current_user),
+    db=Depends(get_db)
+):
+    try:
+        user_id = get_current_user.get("sub")
+        if not user_id:
+            raise HTTPException(status_code=401, detail="Unauthorized")
+        
+        return list_followers_service(target_type, target_id, db, cursor, limit)
+    
+    except HTTPException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+    except DatabaseError as e:
+        raise HTTPException(status_code=500, detail="Database error: " + str(e))
+    
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Internal server error: " + str(e))
+    
 @router.post('/follow/user/{following_user_id}')
 def add_following_u(
     following_user_id: str,
@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from psycopg2 import DatabaseError
-from services.saves.saves_services import get_saves_service, save_issue_service, unsave_issue_service
+from services.saves.saves_services import SAVES_PAGE_SIZE, get_saves_service, save_issue_service, unsave_issue_service
+from typing import Optional
 from utils.db import get_db
 from utils.jwt_guard import get_current_user
 from uuid import UUID
@@ -9,6 +10,8 @@ router = APIRouter(prefix = "/save", tags = ["saves"])
 
 @router.get("/")
 def get_saves(
+    cursor: Optional[str] = None,
+    limit: int = Query(SAVES_PAGE_SIZE, ge=1, le=100),
     get_current_user=Depends(get_current_user),
     db=Depends(get_db)
 ):
@@ -17,7 +20,7 @@ def get_saves(
         if not user_id:
             raise HTTPException(status_code=401, detail="Unauthorized")
         
-        return get_saves_service(user_id, db)
+        return get_saves_service(user_id, db, cursor, limit)
     except HTTPException as e:
         raise HTTPException(status_code=e.status_code, detail=e.detail)
     except DatabaseError as e:
@@ -1,12 +1,15 @@
 import datetime
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from schemas.thread import ThreadCreate, ThreadUpdate
-from utils.db import get_db
+from utils.db import get_async_db
 from utils.jwt_guard import get_current_user
 from services.threads.thread_services import (
+    THREAD_PAGE_SIZE,
     fetch_threads_by_issue_id,
+    normalize_thread_id,
     create_thread_in_db,
     update_thread_in_db,
     delete_thread_in_db
@@ -17,33 +20,41 @@ router = APIRouter(prefix="/threads", tags=["threads"])
 
 
 @router.get("/{issue_id}")
-async def get_threads(issue_id: str, db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+async def get_threads(
+    issue_id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(THREAD_PAGE_SIZE, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user)
+):
     try:
         user_id = current_user.get("sub")
         if not user_id:
             raise HTTPException(
                 status_code=401, detail="User not authenticated.")
-        return await fetch_threads_by_issue_id(issue_id, user_id, db)
+        return await fetch_threads_by_issue_id(issue_id, user_id, db, cursor, limit)
+    except HTTPException:
+        raise
     except Exception:
         raise HTTPException(
             status_code=500, detail="Failed to fetch threads. Please try again later.")
 
 
 @router.post("/")
-def create_thread(thread_data: ThreadCreate, db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+async def create_thread(thread_data: ThreadCreate, db: AsyncSession = Depends(get_async_db), current_user: dict = Depends(get_current_user)):
     try:
         user_id = current_user.get("sub")
         if not user_id:
             raise HTTPException(
                 status_code=401, detail="User not authenticated.")
-        return create_thread_in_db(thread_data, user_id, db)
+        return await create_thread_in_db(thread_data, user_id, db)
     except Exception:
         raise HTTPException(
             status_code=500, detail="Failed to create thread. Please try again later.")
 
 
 @router.put("/{thread_id}")
-def update_thread(thread_id: str, thread_data: ThreadUpdate, db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+async def update_thread(thread_id: str, thread_data: ThreadUpdate, db: AsyncSession = Depends(get_async_db), current_user: dict = Depends(get_current_user)):
     try:
         user_id = current_user.get("sub")
         if not user_id:
@@ -51,33 +62,35 @@ def update_thread(thread_id: str, thread_data: ThreadUpdate, db: Session = Depen
                 status_code=401, detail="User not authenticated.")
         
         thread_data.is_edited = True  # Ensure the thread is marked as edited
-        return update_thread_in_db(thread_id, thread_data, user_id, db)
+        return await update_thread_in_db(thread_id, thread_data, user_id, db)
     except Exception:
         raise HTTPException(
             status_code=500, detail="Failed to update thread. Please try again later.")
 
 
 @router.delete("/{thread_id}")
-def delete_thread(thread_id: str, db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+async def delete_thread(thread_id: str, db: AsyncSession = Depends(get_async_db), current_user: dict = Depends(get_current_user)):
     try:
         user_id = current_user.get("sub")
         if not user_id:
             raise HTTPException(
                 status_code=401, detail="User not authenticated.")
-        return delete_thread_in_db(thread_id, user_id, db)
+        return await delete_thread_in_db(thread_id, user_id, db)
     except Exception:
         raise HTTPException(
             status_code=500, detail="Failed to delete thread. Please try again later.") 
         
 @router.post("/{thread_id}/support")
 async def support_thread(thread_id: str, current_user: dict = Depends(get_current_user)):
+    thread_id = normalize_thread_id(thread_id)
     try:
         user_id = current_user.get("sub")
         
-        if thread_supports.find_one({"thread_id": thread_id, "user_id": user_id}):
-            await thread_supports.delete_one({"thread_id": thread_id, "user_id": user_id})
+        removed = await thread_supports.delete_one({"thread_id": thread_id, "user_id": user_id})
+        if removed.deleted_count:
+            return {"message": "Unsupported"}
         await thread_supports.insert_one({
-            "thread_id": (thread_id),
+            "thread_id": thread_id,
             "user_id": user_id,
             "created_at": datetime.datetime.utcnow()
         })
@@ -87,6 +100,7 @@ async def support_thread(thread_id: str, current_user: dict = Depends(get_curren
 
 @router.get("/{thread_id}/supports")
 async def get_thread_supports(thread_id: str):
+    thread_id = normalize_thread_id(thread_id)
     try:
         supports = await thread_supports.count_documents({"thread_id": thread_id})
         return {"supports": supports, "thread_id": thread_id}
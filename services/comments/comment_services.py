@@ -1,39 +1,138 @@
+import asyncio
+import os
+import uuid
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 from fastapi import HTTPException
 from models.comment import Comment
 from schemas.comment import CommentCreate, CommentUpdate
 from utils.mdb import comment_likes
+from utils.pagination import decode_cursor, encode_cursor
 from models.profile import Profile
-
-async def fetch_comments_by_issue_id(issue_id: str, db: Session):
+from services.viewer_state import resolve_viewer_state
+
+COMMENT_PAGE_SIZE = int(os.getenv("COMMENT_PAGE_SIZE", 20))
+# Replies embedded under each top-level comment; the rest are paged on demand
+REPLY_PREVIEW_SIZE = int(os.getenv("REPLY_PREVIEW_SIZE", 3))
+
+async def load_comment_likes(comment_ids: list) -> dict:
+    """
+    Count likes for a set of comments in one aggregation.
+
+    :return: Mapping of comment ID (str) to its like count.
+    """
+    comment_ids = [str(comment_id) for comment_id in comment_ids]
+    if not comment_ids:
+        return {}
+
+    pipeline = [
+        {"$match": {"comment_id": {"$in": comment_ids}}},
+        {"$group": {"_id": "$comment_id", "likes": {"$sum": 1}}},
+    ]
+    likes = {comment_id: 0 for comment_id in comment_ids}
+    async for row in comment_likes.aggregate(pipeline):
+        likes[row["_id"]] = row["likes"]
+    return likes
+
+
+async def _resolve_comment_likes(db: AsyncSession, comment_ids: list, user_id: str | None) -> dict:
+    likes, viewer = await asyncio.gather(
+        load_comment_likes(comment_ids),
+        resolve_viewer_state(db, user_id, comment_ids=comment_ids),
+    )
+    return {
+        comment_id: {"likes": count, "is_liked": comment_id in viewer["liked_comments"]}
+        for comment_id, count in likes.items()
+    }
+
+
+def _with_likes(comment, likes: dict) -> dict:
+    comment_likes_state = likes[str(comment.id)]
+    return {
+        "comment": comment,
+        "supports": comment_likes_state["likes"],
+        "is_supported": comment_likes_state["is_liked"],
+    }
+
+
+async def fetch_comments_by_issue_id(
+    issue_id: str,
+    db: AsyncSession,
+    user_id: str | None = None,
+    cursor: str | None = None,
+    limit: int = COMMENT_PAGE_SIZE
+):
+    """
+    Page through an issue's top-level comments, newest first.
+
+    Each comment carries its reply_count, its first REPLY_PREVIEW_SIZE replies
+    (oldest first) and a cursor for /comments/{comment_id}/replies when more
+    remain. Replies for the whole page come from a single windowed query.
+    """
     try:
-        top_level_comments = db.query(Comment).filter(
+        query = select(Comment).where(
             Comment.issue_id == issue_id,
             Comment.is_reply == False,
             Comment.is_deleted == False
-        ).order_by(Comment.created_at.desc()).all()
+        )
+        if cursor:
+            cursor_created_at, cursor_id = decode_cursor(cursor, datetime.fromisoformat, uuid.UUID)
+            query = query.where(
+                tuple_(Comment.created_at, Comment.id) < tuple_(cursor_created_at, cursor_id))
+        top_level_comments = (await db.execute(
+            query.order_by(Comment.created_at.desc(), Comment.id.desc()).limit(limit + 1)
+        )).scalars().all()
+
+        next_cursor = None
+        if len(top_level_comments) > limit:
+            top_level_comments = top_level_comments[:limit]
+            next_cursor = encode_cursor(top_level_comments[-1].created_at, top_level_comments[-1].id)
+
+        replies_by_parent = {comment.id: [] for comment in top_level_comments}
+        reply_counts = {}
+        if top_level_comments:
+            reply_order = (Comment.created_at, Comment.id)
+            ranked = select(
+                Comment,
+                func.row_number().over(partition_by=Comment.comment_id, order_by=reply_order).label("position"),
+                func.count().over(partition_by=Comment.comment_id).label("reply_count"),
+            ).where(
+                Comment.comment_id.in_(list(replies_by_parent)),
+                Comment.is_reply == True,
+                Comment.is_deleted == False
+            ).subquery()
+            reply = aliased(Comment, ranked)
+            rows = await db.execute(
+                select(reply, ranked.c.reply_count)
+                .where(ranked.c.position <= REPLY_PREVIEW_SIZE)
+                .order_by(ranked.c.comment_id, ranked.c.position)
+            )
+            for comment, reply_count in rows:
+                replies_by_parent[comment.comment_id].append(comment)
+                reply_counts[comment.comment_id] = reply_count
+
+        previews = [reply for replies in replies_by_parent.values() for reply in replies]
+        likes = await _resolve_comment_likes(
+            db, [comment.id for comment in top_level_comments] + [reply.id for reply in previews], user_id)
 
         comments_with_replies = []
 
         for comment in top_level_comments:
-            # Fetch replies to this comment
-            replies = db.query(Comment).filter(
-                Comment.comment_id == comment.id,
-                Comment.is_reply == True,
-                Comment.is_deleted == False
-            ).all()
-            likes = await comment_likes.count_documents({"comment_id": comment.id})
-            is_liked = await comment_likes.find_one({"comment_id": comment.id, "user_id": comment.user_id})
-
+            replies = replies_by_parent[comment.id]
+            reply_count = reply_counts.get(comment.id, 0)
             comments_with_replies.append({
-                "comment": comment,
-                "supports": likes,
-                "is_supported": True if is_liked else False,
-                "replies": replies
+                **_with_likes(comment, likes),
+                "reply_count": reply_count,
+                "replies": [_with_likes(reply, likes) for reply in replies],
+                "next_replies_cursor": encode_cursor(replies[-1].created_at, replies[-1].id)
+                if reply_count > len(replies) else None,
             })
 
-        return comments_with_replies
+        return {"comments": comments_with_replies, "next_cursor": next_cursor}
+    except HTTPException:
+        raise
     except Exception as e:
         import logging
         logging.exception("Exception while fetching comments : %s", e)
@@ -41,9 +140,53 @@ async def fetch_comments_by_issue_id(issue_id: str, db: Session):
             status_code=500, detail="Failed to fetch comments. Please try again later.")
 
 
-def create_comment_in_db(comment_data, user_id: str, db: Session):
+async def fetch_comment_replies(
+    comment_id: str,
+    db: AsyncSession,
+    user_id: str | None = None,
+    cursor: str | None = None,
+    limit: int = COMMENT_PAGE_SIZE
+):
+    """
+    Page through the replies to one comment, oldest first.
+    """
+    try:
+        query = select(Comment).where(
+            Comment.comment_id == comment_id,
+            Comment.is_reply == True,
+            Comment.is_deleted == False
+        )
+        if cursor:
+            cursor_created_at, cursor_id = decode_cursor(cursor, datetime.fromisoformat, uuid.UUID)
+            query = query.where(
+                tuple_(Comment.created_at, Comment.id) > tuple_(cursor_created_at, cursor_id))
+        replies = (await db.execute(
+            query.order_by(Comment.created_at, Comment.id).limit(limit + 1)
+        )).scalars().all()
+
+        next_cursor = None
+        if len(replies) > limit:
+            replies = replies[:limit]
+            next_cursor = encode_cursor(replies[-1].created_at, replies[-1].id)
+
+        likes = await _resolve_comment_likes(db, [reply.id for reply in replies], user_id)
+        return {
+            "replies": [_with_likes(reply, likes) for reply in replies],
+            "next_cursor": next_cursor,
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        import logging
+        logging.exception("Exception while fetching replies : %s", e)
+        raise HTTPException(
+            status_code=500, detail="Failed to fetch replies. Please try again later.")
+
+
+async def create_comment_in_db(comment_data, user_id: str, db: AsyncSession):
     try:
-        username = db.query(Profile).filter(Profile.user_id == user_id).first()
+        username = (await db.execute(
+            select(Profile).where(Profile.user_id == user_id))).scalars().first()
         
         new_comment = Comment(
             issue_id=comment_data.issue_id,
@@ -62,8 +205,8 @@ def create_comment_in_db(comment_data, user_id: str, db: Session):
                 status_code=400, detail="Comment ID is required for replies.")
 
         db.add(new_comment)
-        db.commit()
-        db.refresh(new_comment)
+        await db.commit()
+        await db.refresh(new_comment)
 
         return new_comment
     except Exception as e:
@@ -73,33 +216,33 @@ def create_comment_in_db(comment_data, user_id: str, db: Session):
             status_code=500, detail="Failed to create comment. Please try again later.")
 
 
-def update_comment_in_db(comment_id: str, comment_data: CommentUpdate, user_id: str, db: Session):
+async def update_comment_in_db(comment_id: str, comment_data: CommentUpdate, user_id: str, db: AsyncSession):
     try:
-        comment = db.query(Comment).filter(
-            Comment.id == comment_id, Comment.user_id == user_id).first()
+        comment = (await db.execute(select(Comment).where(
+            Comment.id == comment_id, Comment.user_id == user_id))).scalars().first()
         if not comment:
             raise HTTPException(status_code=404, detail="Comment not found.")
         for attr, value in comment_data.dict(exclude_unset=True).items():
             setattr(comment, attr, value)
 
         comment.is_edited = True
-        db.commit()
-        db.refresh(comment)
+        await db.commit()
+        await db.refresh(comment)
         return comment
     except Exception:
         raise HTTPException(
             status_code=500, detail="Failed to update comment. Please try again later.")
 
 
-def delete_comment_in_db(comment_id: str, user_id: str, db: Session):
+async def delete_comment_in_db(comment_id: str, user_id: str, db: AsyncSession):
     try:
-        comment = db.query(Comment).filter(
-            Comment.id == comment_id, Comment.user_id == user_id).first()
+        comment = (await db.execute(select(Comment).where(
+            Comment.id == comment_id, Comment.user_id == user_id))).scalars().first()
         if not comment:
             raise HTTPException(status_code=404, detail="Comment not found.")
 
         comment.is_deleted = True
-        db.commit()
+        await db.commit()
         return {"detail": "Comment deleted successfully."}
     except Exception:
         raise HTTPException(
@@ -0,0 +1,150 @@
+import datetime
+import heapq
+import os
+import uuid
+from fastapi import HTTPException
+from sqlalchemy import case, cast, literal, select, tuple_, union_all
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.follow import FOLLOW_UUID_PATTERN, Follow
+from models.issue import Issue
+from services.issues.engagement_services import load_issue_engagement
+from services.viewer_state import resolve_viewer_state
+from utils.pagination import decode_cursor, encode_cursor
+
+FEED_PAGE_SIZE = int(os.getenv("FEED_PAGE_SIZE", 20))
+
+# source -> (issue column, follow target type); a followed location matches any level
+FOLLOWING_FEED_SOURCES = {
+    "users": (Issue.user_id, "user"),
+    "issues": (Issue.id, "issue"),
+    "depts": (Issue.dept_id, "dept"),
+    "states": (Issue.state, "location"),
+    "districts": (Issue.district, "location"),
+    "taluks": (Issue.taluk, "location"),
+    "villages": (Issue.village, "location"),
+}
+
+
+def _decode_positions(cursor: str | None) -> dict:
+    """
+    Per-source positions from a following-feed cursor.
+
+    A position is the (created_at, id) of the last issue consumed from that
+    source, None when the source has not been read yet, or "done" once it is
+    exhausted.
+    """
+    if not cursor:
+        return {source: None for source in FOLLOWING_FEED_SOURCES}
+    (stored,) = decode_cursor(cursor, dict)
+    positions = {}
+    try:
+        for source in FOLLOWING_FEED_SOURCES:
+            position = stored.get(source)
+            if position is None or position == "done":
+                positions[source] = position
+            else:
+                created_at, issue_id = position
+                positions[source] = (datetime.datetime.fromisoformat(created_at), uuid.UUID(issue_id))
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+    return positions
+
+
+def _source_query(source: str, follower_id: uuid.UUID, position, limit: int):
+    column, target_type = FOLLOWING_FEED_SOURCES[source]
+    target = Follow.target_id
+    if target_type != "location":
+        # A stray non-UUID target_id yields NULL and matches nothing instead of failing the cast
+        target = case(
+            (Follow.target_id.op("~")(FOLLOW_UUID_PATTERN), cast(Follow.target_id, PG_UUID(as_uuid=True))))
+    followed = select(target).where(Follow.follower_id == follower_id, Follow.target_type == target_type)
+
+    query = select(literal(source).label("source"), Issue.id, Issue.created_at).where(
+        Issue.is_deleted == False, column.in_(followed))
+    if position is not None:
+        query = query.where(tuple_(Issue.created_at, Issue.id) < tuple_(*position))
+    # Same order as the 0001 feed indexes, so each branch stops after LIMIT rows
+    return query.order_by(Issue.created_at.desc(), Issue.id.desc()).limit(limit).subquery()
+
+
+async def get_following_feed(db: AsyncSession, user_id: str, cursor: str | None, limit: int = FEED_PAGE_SIZE):
+    """
+    Timeline of issues from everything the user follows, newest first.
+
+    Every follow dimension contributes at most ``limit`` issues past its own
+    position, read in one UNION ALL of limited, index-ordered branches. The
+    branches are k-way merged on (created_at, id) with a heap. An issue reached
+    through several follows is shown once and advances each of those sources.
+    The cursor stores a position per source, so each page reads
+    O(limit * sources) rows however much the user follows.
+
+    :return: {"issues": [{"issue", counts..., viewer flags, "followed_via"}], "next_cursor"}
+    """
+    try:
+        follower_id = uuid.UUID(str(user_id))
+    except ValueError:
+        raise HTTPException(status_code=401, detail="User not authenticated.")
+
+    positions = _decode_positions(cursor)
+    active = [source for source, position in positions.items() if position != "done"]
+
+    fetched = {source: [] for source in active}
+    if active:
+        branches = [_source_query(source, follower_id, positions[source], limit) for source in active]
+        rows = await db.execute(union_all(*[select(branch) for branch in branches]))
+        for row in rows:
+            fetched[row.source].append((row.created_at, row.id))
+    for candidates in fetched.values():
+        candidates.sort(reverse=True)
+
+    merged = heapq.merge(
+        *[[(key, source) for key in candidates] for source, candidates in fetched.items()],
+        reverse=True,
+    )
+    consumed = {source: 0 for source in fetched}
+    page, followed_via = [], {}
+    for key, source in merged:
+        issue_id = key[1]
+        if issue_id in followed_via:
+            # Duplicates share the same key, so they arrive right after the first copy
+            followed_via[issue_id].append(source)
+        elif len(page) < limit:
+            page.append(key)
+            followed_via[issue_id] = [source]
+        else:
+            break
+        consumed[source] += 1
+        positions[source] = key
+
+    for source, candidates in fetched.items():
+        if consumed[source] == len(candidates) and len(candidates) < limit:
+            positions[source] = "done"
+
+    next_cursor = None
+    if any(position != "done" for position in positions.values()):
+        next_cursor = encode_cursor(positions)
+
+    issues = {}
+    if page:
+        issues = {issue.id: issue for issue in (await db.execute(
+            select(Issue).where(Issue.id.in_([issue_id for _, issue_id in page]))
+        )).scalars()}
+    issue_ids = [issue_id for _, issue_id in page if issue_id in issues]
+    engagement = await load_issue_engagement(issue_ids)
+    viewer = await resolve_viewer_state(db, user_id, issue_ids=issue_ids)
+
+    return {
+        "issues": [
+            {
+                "issue": issues[issue_id],
+                **engagement[str(issue_id)],
+                "is_saved": str(issue_id) in viewer["saved"],
+                "is_supported": str(issue_id) in viewer["supported"],
+                "is_liked": str(issue_id) in viewer["liked"],
+                "followed_via": followed_via[issue_id],
+            }
+            for issue_id in issue_ids
+        ],
+        "next_cursor": next_cursor,
+    }
@@ -1,19 +1,22 @@
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
-from models.issue_depts import IssueDept
-from models.employee import Employee
-from sqlalchemy import asc
+from models.leaderboards import dept_leaderboard, official_leaderboard
+from sqlalchemy import asc, select
 
 def get_bottom_departments_from_db(db: Session, ):
     try:
-        bottom_depts = db.query(IssueDept).order_by(asc(IssueDept.negative_count + IssueDept.positive_count)).limit(3).all()
-        return [(dept.id, dept.dept_name, dept.negative_count + dept.positive_count, dept.state) for dept in bottom_depts]
+        bottom_depts = db.execute(
+            select(dept_leaderboard).order_by(asc(dept_leaderboard.c.score), dept_leaderboard.c.dept_id).limit(3)
+        ).all()
+        return [(dept.dept_id, dept.dept_name, dept.score, dept.location) for dept in bottom_depts]
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch bottom departments: {str(e)}")
 
 def get_bottom_officials_from_db(db: Session, ):
     try:
-        bottom_officials = db.query(Employee).order_by(asc(Employee.false_count + Employee.good_count)).limit(3).all()
-        return [(official.id, official.name, official.false_count + official.good_count, official.state) for official in bottom_officials]
+        bottom_officials = db.execute(
+            select(official_leaderboard).order_by(asc(official_leaderboard.c.score), official_leaderboard.c.employee_id).limit(3)
+        ).all()
+        return [(official.employee_id, official.fullname, official.score, official.state) for official in bottom_officials]
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch bottom officials: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,216 @@
+import asyncio
+import datetime
+from pymongo import UpdateOne
+from pymongo.errors import DuplicateKeyError
+from utils import mdb
+from utils.hll import HyperLogLog
+
+ENGAGEMENT_FIELDS = ("views", "supports", "shares", "likes")
+# Leaves the unique-viewer sketch (a few KB) out of list reads
+_COUNTER_PROJECTION = {field: 1 for field in ENGAGEMENT_FIELDS}
+
+
+def bucket_starts(at: datetime.datetime) -> dict:
+    """Start of the hourly and daily rollup buckets containing ``at`` (naive UTC)."""
+    hour = at.replace(minute=0, second=0, microsecond=0)
+    return {"hour": hour, "day": hour.replace(hour=0)}
+
+
+def bucket_operations(issue_id: str, increments: dict, at: datetime.datetime) -> list:
+    """Upserts adding ``increments`` to the issue's hourly and daily buckets at ``at``."""
+    return [
+        UpdateOne(
+            {"issue_id": str(issue_id), "granularity": granularity, "bucket": start},
+            {"$inc": increments},
+            upsert=True,
+        )
+        for granularity, start in bucket_starts(at).items()
+    ]
+
+
+async def record_engagement(issue_id: str, field: str, delta: int = 1):
+    """
+    Apply an engagement event to the issue's counter document and its
+    hourly and daily rollup buckets.
+
+    :param issue_id: ID of the issue the event belongs to.
+    :param field: One of ENGAGEMENT_FIELDS.
+    :param delta: Amount to add, negative when an event is removed.
+    """
+    await asyncio.gather(
+        mdb.issue_stats.update_one(
+            {"_id": str(issue_id)}, {"$inc": {field: delta}}, upsert=True),
+        mdb.engagement_buckets.bulk_write(
+            bucket_operations(issue_id, {field: delta}, datetime.datetime.utcnow()), ordered=False),
+    )
+
+
+async def sum_engagement_window(issue_ids: list, hours: int, now: datetime.datetime | None = None) -> dict:
+    """
+    Sum engagement over the last ``hours`` hours, including the current one.
+
+    Whole days inside the window are read from daily buckets and only the ragged
+    edges from hourly ones, so a window touches at most 47 hourly documents plus
+    one per full day. Removals are counted in the bucket they happened in, so
+    totals are net changes within the window.
+
+    :param issue_ids: Issues to sum.
+    :param hours: Window length in hours.
+    :param now: End of the window (naive UTC); defaults to the current time.
+    :return: Mapping of issue ID (str) to summed counts.
+    """
+    issue_ids = [str(issue_id) for issue_id in issue_ids]
+    if not issue_ids:
+        return {}
+
+    current_hour = bucket_starts(now or datetime.datetime.utcnow())["hour"]
+    window_start = current_hour - datetime.timedelta(hours=hours - 1)
+    first_full_day = bucket_starts(window_start)["day"]
+    if first_full_day < window_start:
+        first_full_day += datetime.timedelta(days=1)
+    today = current_hour.replace(hour=0)
+
+    if first_full_day < today:
+        ranges = [
+            {"granularity": "hour", "bucket": {"$gte": window_start, "$lt": first_full_day}},
+            {"granularity": "day", "bucket": {"$gte": first_full_day, "$lt": today}},
+            {"granularity": "hour", "bucket": {"$gte": today}},
+        ]
+    else:
+        ranges = [{"granularity": "hour", "bucket": {"$gte": window_start}}]
+
+    pipeline = [
+        {"$match": {"issue_id": {"$in": issue_ids}, "$or": ranges}},
+        {"$group": {"_id": "$issue_id", **{field: {"$sum": f"${field}"} for field in ENGAGEMENT_FIELDS}}},
+    ]
+    totals = {}
+    async for row in mdb.engagement_buckets.aggregate(pipeline):
+        totals[row["_id"]] = row
+
+    return {
+        issue_id: {field: totals.get(issue_id, {}).get(field, 0) for field in ENGAGEMENT_FIELDS}
+        for issue_id in issue_ids
+    }
+
+
+async def load_issue_engagement(issue_ids: list) -> dict:
+    """
+    Resolve views, supports, shares and likes for a page of issues.
+
+    :param issue_ids: IDs of the issues on the page.
+    :return: Mapping of issue ID (str) to its engagement counts.
+    """
+    issue_ids = [str(issue_id) for issue_id in issue_ids]
+    if not issue_ids:
+        return {}
+
+    stats = {}
+    async for doc in mdb.issue_stats.find({"_id": {"$in": issue_ids}}, _COUNTER_PROJECTION):
+        stats[doc["_id"]] = doc
+
+    return {
+        issue_id: {
+            field: max(stats.get(issue_id, {}).get(field, 0), 0)
+            for field in ENGAGEMENT_FIELDS
+        }
+        for issue_id in issue_ids
+    }
+
+
+async def load_issue_stats(issue_id: str) -> dict:
+    """
+    Resolve engagement counts and the unique-viewer estimate for one issue.
+
+    :param issue_id: ID of the issue.
+    :return: Engagement counts plus ``unique_viewers``.
+    """
+    doc = await mdb.issue_stats.find_one({"_id": str(issue_id)}) or {}
+    stats = {field: max(doc.get(field, 0), 0) for field in ENGAGEMENT_FIELDS}
+    stats["unique_viewers"] = HyperLogLog(doc["viewer_hll"]).count() if doc.get("viewer_hll") else 0
+    return stats
+
+
+async def _count_by_issue(collection, issue_ids: list[str] | None, value=1):
+    pipeline = [{"$group": {"_id": "$issue_id", "total": {"$sum": value}}}]
+    if issue_ids is not None:
+        pipeline.insert(0, {"$match": {"issue_id": {"$in": issue_ids}}})
+    counts = {}
+    async for row in collection.aggregate(pipeline):
+        counts[str(row["_id"])] = row["total"]
+    return counts
+
+
+async def rebuild_issue_stats(issue_ids: list | None = None):
+    """
+    Recompute issue_stats from the raw event collections.
+
+    Likes, supports and shares are overwritten with the event counts. Views
+    are no longer stored anywhere else, so the legacy issue_views total is
+    added to whatever increment_view has already counted, once per issue:
+    legacy_views_seeded marks documents that have received it.
+
+    :param issue_ids: Issues to rebuild, or None for every issue with events.
+    :return: Number of stats documents written.
+    """
+    if issue_ids is not None:
+        issue_ids = [str(issue_id) for issue_id in issue_ids]
+
+    views, supports, shares, likes = await asyncio.gather(
+        _count_by_issue(mdb.issue_views, issue_ids, "$views"),
+        _count_by_issue(mdb.issue_supports, issue_ids),
+        _count_by_issue(mdb.issue_shares, issue_ids),
+        _count_by_issue(mdb.issue_likes, issue_ids),
+    )
+
+    targets = issue_ids if issue_ids is not None else \
+        set(views) | set(supports) | set(shares) | set(likes)
+
+    operations = [
+        UpdateOne(
+            {"_id": issue_id},
+            [{"$set": {
+                "views": {"$cond": [
+                    {"$eq": ["$legacy_views_seeded", True]},
+                    "$views",
+                    {"$add": [{"$ifNull": ["$views", 0]}, views.get(issue_id, 0)]},
+                ]},
+                "legacy_views_seeded": True,
+                "supports": supports.get(issue_id, 0),
+                "shares": shares.get(issue_id, 0),
+                "likes": likes.get(issue_id, 0),
+            }}],
+            upsert=True,
+        )
+        for issue_id in targets
+    ]
+    if operations:
+        await mdb.issue_stats.bulk_write(operations, ordered=False)
+    return len(operations)
+
+
+async def ensure_issue_stats_backfilled():
+    """
+    Run rebuild_issue_stats once per deployment, before requests are served.
+
+    issue_stats is the only place counts are read from, so until it has been
+    built every existing issue reads zero. A marker in the migrations
+    collection makes later startups (and concurrent workers) skip it; the
+    marker is removed again if the rebuild fails so the next start retries.
+    """
+    try:
+        await mdb.migrations.insert_one({"_id": "issue_stats_backfill", "state": "running"})
+    except DuplicateKeyError:
+        return
+    try:
+        rebuilt = await rebuild_issue_stats()
+    except Exception:
+        await mdb.migrations.delete_one({"_id": "issue_stats_backfill"})
+        raise
+    await mdb.migrations.update_one(
+        {"_id": "issue_stats_backfill"},
+        {"$set": {"state": "done", "documents": rebuilt, "finished_at": datetime.datetime.utcnow()}})
+
+
+if __name__ == "__main__":
+    # One-off backfill: python -m services.issues.engagement_services
+    print("Rebuilt", asyncio.run(rebuild_issue_stats()), "issue stats documents")
@@ -1,20 +1,131 @@
 import datetime
+import json
+import os
+import uuid
+from types import SimpleNamespace
 from fastapi import Depends, Query, HTTPException
-from sqlalchemy import UUID, update, or_
-from sqlalchemy.orm import Session
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import UUID, String, case, func, literal_column, select, update, or_, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.issue import Issue
 from models.issue_depts import IssueDept
 from models.profile import Profile
-from models.save import Save
-from utils import mdb
-from utils.db import get_db
+from services.issues.engagement_services import load_issue_engagement, load_issue_stats
+from services.locations import location_directory
+from services.viewer_state import resolve_viewer_state
+from utils.cache import TTLCache
+from utils.db import AsyncSessionLocal, get_async_db
+from utils.pagination import decode_cursor, encode_cursor
+
+
+FEED_FILTER_FIELDS = ("state", "district", "taluk", "area", "issue_type", "department")
+
+FEED_CACHE_TTL_SECONDS = float(os.getenv("FEED_CACHE_TTL_SECONDS", 30))
+FEED_CACHE_MAX_ENTRIES = int(os.getenv("FEED_CACHE_MAX_ENTRIES", 1024))
+
+# Viewer-independent feed pages keyed by (filters, cursor, page, limit)
+feed_cache = TTLCache(FEED_CACHE_MAX_ENTRIES, FEED_CACHE_TTL_SECONDS)
+# Facet counts keyed by filters; invalidated together with feed pages
+facet_cache = TTLCache(FEED_CACHE_MAX_ENTRIES, FEED_CACHE_TTL_SECONDS)
+
+# issue_type is stored as a JSON scalar; #>> '{}' extracts it as text for comparison
+issue_type_text = Issue.issue_type.op("#>>", return_type=String)(literal_column("'{}'"))
+
+
+def normalize_feed_filters(**filters) -> dict:
+    """
+    Strip whitespace and drop empty values so equivalent requests share a cache key.
+
+    department is canonicalized to the form invalidate_feed_cache compares
+    against, so every spelling of a department ID is invalidated together.
+
+    :return: Mapping of every FEED_FILTER_FIELDS name to its value or None.
+    """
+    normalized = {}
+    for field in FEED_FILTER_FIELDS:
+        value = filters.get(field)
+        value = value.strip() if isinstance(value, str) else value
+        normalized[field] = value or None
+    if normalized["department"]:
+        try:
+            normalized["department"] = str(uuid.UUID(str(normalized["department"])))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid department ID.")
+    return normalized
+
+
+def apply_feed_filters(query, filters: dict):
+    if filters["state"]:
+        query = query.where(Issue.state == filters["state"])
+    if filters["district"]:
+        query = query.where(Issue.district == filters["district"])
+    if filters["taluk"]:
+        query = query.where(Issue.taluk == filters["taluk"])
+    if filters["area"]:
+        query = query.where(Issue.village == filters["area"])
+    if filters["issue_type"]:
+        query = query.where(issue_type_text == filters["issue_type"])
+    if filters["department"]:
+        query = query.where(Issue.dept_id == filters["department"])
+    return query
+
+
+def invalidate_feed_cache(*issues):
+    """
+    Drop cached feed pages and facet counts that could include any of the given
+    issue versions.
+
+    A page is affected when each of its state, district and department filters
+    is either unset or equal to the issue's value.
+    """
+    for issue in issues:
+        state, district, dept_id = issue.state, issue.district, str(issue.dept_id) if issue.dept_id else None
+
+        def affected(filters):
+            return (filters["state"] in (None, state)
+                    and filters["district"] in (None, district)
+                    and filters["department"] in (None, dept_id))
+
+        feed_cache.invalidate(affected)
+        facet_cache.invalidate(affected)
+
+
+async def _load_feed_page(db: AsyncSession, filters: dict, cursor: str | None, page: int, limit: int):
+    query = apply_feed_filters(select(Issue).where(Issue.is_deleted == False), filters)
+
+    if cursor:
+        cursor_created_at, cursor_id = decode_cursor(
+            cursor, datetime.datetime.fromisoformat, uuid.UUID)
+        # Seek past the last row of the previous page; matches the ORDER BY below
+        query = query.where(
+            tuple_(Issue.created_at, Issue.id) < tuple_(cursor_created_at, cursor_id))
+
+    # Latest issues first; id breaks ties between equal timestamps
+    query = query.order_by(Issue.created_at.desc(), Issue.id.desc())
+    if not cursor and page > 1:
+        # Legacy offset paging, kept for clients that have not moved to cursors
+        query = query.offset((page - 1) * limit)
+    issues = (await db.execute(query.limit(limit + 1))).scalars().all()
+
+    next_cursor = None
+    if len(issues) > limit:
+        issues = issues[:limit]
+        # A NULL key cannot be sought past; migration 0010 makes created_at NOT NULL
+        if issues[-1].created_at is not None:
+            next_cursor = encode_cursor(issues[-1].created_at, issues[-1].id)
+
+    engagement = await load_issue_engagement([issue.id for issue in issues])
+    return {
+        "issues": [{"issue": issue, **engagement[str(issue.id)]} for issue in issues],
+        "next_cursor": next_cursor,
+    }
 
 
 async def get_latest_issues(
     page: int,
     cursor: str | None,
     limit: int,
-    db: Session,
+    db: AsyncSession,
     state: str | None = None,
     district: str | None = None,
     taluk: str | None = None,
@@ -24,62 +135,33 @@ async def get_latest_issues(
     user_id: str | None = None
 ):
     try:
-        query = db.query(Issue).filter(Issue.is_deleted == False)
-
-        if cursor:
-            try:
-                cursor_dt = datetime.datetime.fromisoformat(cursor)
-            except ValueError:
-                raise HTTPException(
-                    status_code=400, detail="Invalid cursor format. Use ISO format.")
-            query = query.filter(Issue.issue_time < cursor_dt)
-
-        if state:
-            query = query.filter(Issue.state == state)
-        if district:
-            query = query.filter(Issue.district == district)
-        if taluk:
-            query = query.filter(Issue.taluk == taluk)
-        if area:
-            query = query.filter(Issue.village == area)
-        if issue_type:
-            query = query.filter(Issue.issue_type == issue_type)
-        if department:
-            query = query.filter(Issue.dept == department)
-
-        # Ensure latest issues come first by ordering by issue_time DESC
-        issues = (
-            query.order_by(Issue.created_at.desc())
-            .limit(limit)
-            .offset((page - 1) * limit)
-            .all()
-        )
+        filters = normalize_feed_filters(
+            state=state, district=district, taluk=taluk, area=area,
+            issue_type=issue_type, department=department)
+        cache_key = (tuple(filters.items()), cursor, None if cursor else page, limit)
 
-        result = []
-
-        for issue in issues:
-            issue_views = await mdb.issue_views.count_documents({"issue_id": str(issue.id)})
-            issue_support = await mdb.issue_supports.count_documents({"issue_id": str(issue.id)})
-            issue_shares = await mdb.issue_shares.count_documents({"issue_id": str(issue.id)})
-            issue_likes = await mdb.issue_likes.count_documents({"issue_id": str(issue.id)})
+        feed_page = feed_cache.get(cache_key)
+        if feed_page is None:
+            feed_page = await _load_feed_page(db, filters, cursor, page, limit)
+            feed_cache.set(cache_key, feed_page, filters)
 
-            is_saved = db.query(Save).filter(Save.issue_id == issue.id).first()
-            issue_saved = True if is_saved else False
+        viewer = await resolve_viewer_state(
+            db, user_id, issue_ids=[entry["issue"].id for entry in feed_page["issues"]])
 
-            is_supported = await mdb.issue_supports.find_one({"issue_id": str(issue.id), "user_id": str(user_id)})
-            issue_supported = True if is_supported else False
+        result = []
 
+        for entry in feed_page["issues"]:
+            issue_id = str(entry["issue"].id)
             result.append({
-                "issue": issue,
-                "views": issue_views,
-                "supports": issue_support,
-                "shares": issue_shares,
-                "likes": issue_likes,
-                "is_saved": issue_saved,
-                "is_supported": issue_supported
+                **entry,
+                "is_saved": issue_id in viewer["saved"],
+                "is_supported": issue_id in viewer["supported"],
+                "is_liked": issue_id in viewer["liked"]
             })
 
-        return result
+        return {"issues": result, "next_cursor": feed_page["next_cursor"]}
+    except HTTPException:
+        raise
     except Exception as e:
         import logging
         logging.exception("Exception while fetching issues : %s", e)
@@ -88,27 +170,86 @@ async def get_latest_issues(
         )
 
 
+async def get_issue_facets(db: AsyncSession, **filters):
+    """
+    Count live issues per state, district, department, issue type and status
+    under the same filters as the /issues feed, in a single GROUPING SETS scan.
+
+    :return: {"total": int, <facet>: [{"value", "count"}, ...]} with each facet
+        sorted by count; districts also carry their state.
+    """
+    filters = normalize_feed_filters(**filters)
+    cache_key = tuple(filters.items())
+    facets = facet_cache.get(cache_key)
+    if facets is not None:
+        return facets
+
+    grouped = (Issue.state, Issue.district, Issue.dept_id, issue_type_text, Issue.current_status)
+    query = apply_feed_filters(
+        select(
+            *grouped,
+            *(func.grouping(column) for column in grouped),
+            func.count().label("count"),
+        ).where(Issue.is_deleted == False),
+        filters,
+    ).group_by(func.grouping_sets(
+        literal_column("()"),
+        tuple_(Issue.state),
+        # District names repeat across states
+        tuple_(Issue.state, Issue.district),
+        tuple_(Issue.dept_id),
+        tuple_(issue_type_text),
+        tuple_(Issue.current_status),
+    ))
+
+    facets = {"total": 0, "state": [], "district": [], "department": [], "issue_type": [], "status": []}
+    for state, district, dept_id, issue_type, status, *grouping, count in (await db.execute(query)).all():
+        state_g, district_g, dept_g, type_g, status_g = grouping
+        if all(grouping):
+            facets["total"] = count
+        elif not district_g:
+            if district is not None:
+                facets["district"].append({"state": state, "value": district, "count": count})
+        elif not state_g:
+            if state is not None:
+                facets["state"].append({"value": state, "count": count})
+        elif not dept_g:
+            if dept_id is not None:
+                facets["department"].append({"value": str(dept_id), "count": count})
+        elif not type_g:
+            if issue_type is not None:
+                facets["issue_type"].append({"value": issue_type, "count": count})
+        elif status is not None:
+            facets["status"].append({"value": status, "count": count})
+
+    for name, buckets in facets.items():
+        if name != "total":
+            buckets.sort(key=lambda bucket: -bucket["count"])
+    facet_cache.set(cache_key, facets, filters)
+    return facets
+
+
 async def get_latest_issues_admin(
     page: int = 1,
     limit: int = 10,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     try:
         offset = (page - 1) * limit
 
         query = (
-            db.query(Issue)
-            .filter(Issue.is_deleted == False)
+            select(Issue)
+            .where(Issue.is_deleted == False)
             .order_by(Issue.created_at.desc())
             .offset(offset)
             .limit(limit)
         )
 
-        issues = query.all()
+        issues = (await db.execute(query)).scalars().all()
+        engagement = await load_issue_engagement([issue.id for issue in issues])
         result = []
         for issue in issues:
-            total_supports = await mdb.issue_supports.count_documents(
-                {"issue_id": str(issue.id)})
+            total_supports = engagement[str(issue.id)]["supports"]
             result.append({"issue": issue, "supports": total_supports})
         return result
     except Exception:
@@ -116,10 +257,167 @@ async def get_latest_issues_admin(
             status_code=500, detail="Failed to fetch issues. Please try again later.")
 
 
-from sqlalchemy import or_
+# Must match the configuration of the generated Issue.search_vector column
+SEARCH_CONFIG = literal_column("'english'::regconfig")
+
+
+async def search_issues(
+    db: AsyncSession,
+    q: str,
+    cursor: str | None,
+    limit: int,
+    user_id: str | None = None,
+    **filters
+):
+    """
+    Full-text search over issue headlines and descriptions.
+
+    Results are ordered by ts_rank_cd (headline matches weigh more) with id as
+    tie-breaker, paged with a (rank, id) keyset cursor, and accept the same
+    filters as the /issues feed.
+
+    :param q: Web-search style query, e.g. ``water leak -sewage``.
+    :return: {"issues": [{"issue", "rank", counts...}], "next_cursor": str | None}
+    """
+    q = q.strip()
+    if not q:
+        raise HTTPException(status_code=400, detail="Search query must not be empty.")
+
+    ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+    rank = func.ts_rank_cd(Issue.search_vector, ts_query)
+    query = apply_feed_filters(
+        select(Issue, rank.label("rank"))
+        .where(Issue.is_deleted == False, Issue.search_vector.op("@@")(ts_query)),
+        normalize_feed_filters(**filters),
+    )
+    if cursor:
+        cursor_rank, cursor_id = decode_cursor(cursor, float, uuid.UUID)
+        query = query.where(tuple_(rank, Issue.id) < tuple_(cursor_rank, cursor_id))
+
+    rows = (await db.execute(query.order_by(rank.desc(), Issue.id.desc()).limit(limit + 1))).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].rank, rows[-1].Issue.id)
+
+    issue_ids = [row.Issue.id for row in rows]
+    engagement = await load_issue_engagement(issue_ids)
+    viewer = await resolve_viewer_state(db, user_id, issue_ids=issue_ids)
+    return {
+        "issues": [
+            {
+                "issue": row.Issue,
+                "rank": row.rank,
+                **engagement[str(row.Issue.id)],
+                "is_saved": str(row.Issue.id) in viewer["saved"],
+                "is_supported": str(row.Issue.id) in viewer["supported"],
+                "is_liked": str(row.Issue.id) in viewer["liked"],
+            }
+            for row in rows
+        ],
+        "next_cursor": next_cursor,
+    }
+
+
+BATCH_FILTER_FIELDS = ("user_ids", "dept_ids", "issue_ids", "states", "districts", "taluks", "villages")
+BATCH_FILTER_STREAM_CHUNK = int(os.getenv("BATCH_FILTER_STREAM_CHUNK", 500))
+
+# criteria field -> (issue column, matched_on label)
+BATCH_FILTER_MATCHES = {
+    "user_ids": (Issue.user_id, "user_id"),
+    "dept_ids": (Issue.dept_id, "dept_id"),
+    "issue_ids": (Issue.id, "issue_id"),
+    "states": (Issue.state, "state"),
+    "districts": (Issue.district, "district"),
+    "taluks": (Issue.taluk, "taluk"),
+    "villages": (Issue.village, "village"),
+}
+
+
+def _batch_filter_query(criteria: dict):
+    """
+    Build one statement returning matching issues with author name, department
+    name and a CASE column per supplied filter telling whether that filter matched.
+    """
+    conditions = []
+    match_columns = []
+    for field, (column, label) in BATCH_FILTER_MATCHES.items():
+        if criteria[field]:
+            condition = column.in_(criteria[field])
+            conditions.append(condition)
+            match_columns.append(case((condition, True), else_=False).label(f"match_{label}"))
+
+    # profile.user_id is not unique; a scalar subquery keeps one row per issue
+    author_name = (
+        select(Profile.fullname)
+        .where(Profile.user_id == Issue.user_id)
+        .order_by(Profile.id)
+        .limit(1)
+        .scalar_subquery()
+    )
+    query = (
+        select(
+            Issue,
+            author_name.label("author_name"),
+            IssueDept.dept.label("dept_name"),
+            *match_columns,
+        )
+        .outerjoin(IssueDept, IssueDept.id == Issue.dept_id)
+        .where(Issue.is_deleted == False)
+    )
+    if conditions:
+        query = query.where(or_(*conditions))
+    return query.order_by(Issue.created_at.desc())
+
+
+async def _hydrate_batch_rows(db: AsyncSession, rows, criteria: dict, user_id: str | None) -> list[dict]:
+    """
+    Attach engagement counts and the viewer's saved state to a chunk of batch filter rows.
+
+    Both lookups are batched per chunk; everything else comes from the row itself.
+    """
+    issue_ids_on_page = [row.Issue.id for row in rows]
+    engagement = await load_issue_engagement(issue_ids_on_page)
+    viewer = await resolve_viewer_state(db, user_id, issue_ids=issue_ids_on_page)
+
+    match_labels = [label for field, (_, label) in BATCH_FILTER_MATCHES.items() if criteria[field]]
+
+    result = []
+    for row in rows:
+        issue = row.Issue
+        counts = engagement[str(issue.id)]
+        result.append({
+            "issue": {
+                "id": str(issue.id),
+                "issue_headline": issue.issue_headline,
+                "issue_desc": issue.issue_desc,
+                "issue_type": issue.issue_type,
+                "created_at": str(issue.created_at),
+                "current_status": issue.current_status,
+                "user_id": issue.user_id,
+                "dept_id": issue.dept_id,
+                "district": issue.district,
+                "state": issue.state,
+                "taluk": issue.taluk,
+                "village": issue.village,
+                "author_name": row.author_name or "Unknown",
+                "issue_dept": row.dept_name or "Unknown",
+                "is_anonymous": issue.is_anonymous,
+                "is_edited": issue.is_edited,
+            },
+            "views": counts["views"],
+            "supports": counts["supports"],
+            "shares": counts["shares"],
+            "likes": counts["likes"],
+            "is_saved": str(issue.id) in viewer["saved"],
+            "matched_on": [label for label in match_labels if row._mapping[f"match_{label}"]],
+        })
+    return result
+
 
 async def get_issues_by_batch_filters(
-    db: Session,
+    db: AsyncSession,
     user_ids: list[str] = None,
     dept_ids: list[str] = None,
     issue_ids: list[str] = None,
@@ -127,88 +425,13 @@ async def get_issues_by_batch_filters(
     districts: list[str] = None,
     taluks: list[str] = None,
     villages: list[str] = None,
+    viewer_id: str | None = None,
 ):
     try:
-        query = db.query(Issue).filter(Issue.is_deleted == False)
-        conditions = []
-        if user_ids:
-            conditions.append(Issue.user_id.in_(user_ids))
-        if dept_ids:
-            conditions.append(Issue.dept_id.in_(dept_ids))
-        if issue_ids:
-            conditions.append(Issue.id.in_(issue_ids))
-        if states:
-            conditions.append(Issue.state.in_(states))
-        if districts:
-            conditions.append(Issue.district.in_(districts))
-        if taluks:
-            conditions.append(Issue.taluk.in_(taluks))
-        if villages:
-            conditions.append(Issue.village.in_(villages))
-        if conditions:
-            query = query.filter(or_(*conditions))
-        issues = query.order_by(Issue.created_at.desc()).all()
-        result = []
-        for issue in issues:
-            # Determine which filter(s) matched
-            matched_on = []
-            if user_ids and str(issue.user_id) in user_ids:
-                matched_on.append("user_id")
-            if dept_ids and str(issue.dept_id) in dept_ids:
-                matched_on.append("dept_id")
-            if issue_ids and str(issue.id) in issue_ids:
-                matched_on.append("issue_id")
-            if states and issue.state in states:
-                matched_on.append("state")
-            if districts and issue.district in districts:
-                matched_on.append("district")
-            if taluks and issue.taluk in taluks:
-                matched_on.append("taluk")
-            if villages and issue.village in villages:
-                matched_on.append("village")
-            
-            issue_author_profile = db.query(Profile).filter(
-                Profile.user_id == issue.user_id).first()
-            issue_author = issue_author_profile.fullname if issue_author_profile else None
-
-            dept_name = db.query(IssueDept).filter(
-                IssueDept.id == issue.dept_id).first()
-            issue_dept_name = dept_name.dept if dept_name else None
-
-            issue_views = await mdb.issue_views.count_documents({"issue_id": str(issue.id)})
-            issue_support = await mdb.issue_supports.count_documents({"issue_id": str(issue.id)})
-            issue_shares = await mdb.issue_shares.count_documents({"issue_id": str(issue.id)})
-            issue_likes = await mdb.issue_likes.count_documents({"issue_id": str(issue.id)})
-            is_saved = db.query(Save).filter(Save.issue_id == issue.id).first()
-            issue_saved = True if is_saved else False
-            result.append({
-                "issue": {
-                    "id": str(issue.id),
-                    "issue_headline": issue.issue_headline,
-                    "issue_desc": issue.issue_desc,
-                    "issue_type": issue.issue_type,
-                    "created_at": str(issue.created_at),
-                    "current_status": issue.current_status,
-                    "user_id": issue.user_id,
-                    "dept_id": issue.dept_id,
-                    "district": issue.district,
-                    "state": issue.state,
-                    "taluk": issue.taluk,
-                    "village": issue.village,
-                    "author_name": issue_author or "Unknown",
-                    "issue_dept": issue_dept_name or "Unknown",
-                    "is_anonymous": issue.is_anonymous,
-                    "is_edited": issue.is_edited,
-                },
-                "views": issue_views,
-                "supports": issue_support,
-                "shares": issue_shares,
-                "likes": issue_likes,
-                "is_saved": issue_saved,
-                "matched_on": matched_on,
-            })
-
-        return result
+        criteria = dict(user_ids=user_ids, dept_ids=dept_ids, issue_ids=issue_ids, states=states,
+                        districts=districts, taluks=taluks, villages=villages)
+        rows = (await db.execute(_batch_filter_query(criteria))).all()
+        return await _hydrate_batch_rows(db, rows, criteria, viewer_id)
     except Exception as e:
         import logging
         logging.exception("Exception while batch filtering issues : %s", e)
@@ -217,30 +440,60 @@ async def get_issues_by_batch_filters(
         )
 
 
-def create_issue_in_db(issue_data, db: Session, user_id: str):
+async def stream_issues_by_batch_filters(viewer_id: str | None = None, **criteria):
+    """
+    Yield batch filter results as NDJSON lines while the rows are still being read.
+
+    Rows come from a server-side cursor in chunks of BATCH_FILTER_STREAM_CHUNK, so
+    memory stays flat regardless of how many issues match. The generator opens its
+    own sessions because request-scoped dependencies are closed before a streaming
+    body is sent.
+    """
+    criteria = {field: criteria.get(field) for field in BATCH_FILTER_FIELDS}
+    query = _batch_filter_query(criteria).execution_options(yield_per=BATCH_FILTER_STREAM_CHUNK)
     try:
+        async with AsyncSessionLocal() as stream_db, AsyncSessionLocal() as lookup_db:
+            result = await stream_db.stream(query)
+            async for chunk in result.partitions():
+                for row in await _hydrate_batch_rows(lookup_db, chunk, criteria, viewer_id):
+                    yield json.dumps(jsonable_encoder(row)) + "\n"
+    except Exception as e:
+        import logging
+        logging.exception("Exception while streaming batch filtered issues : %s", e)
+        # Headers are already sent, so report the failure in-band as the last record
+        yield json.dumps({"error": "Failed to fetch issues. Please try again later."}) + "\n"
 
-        new_issue = Issue(**issue_data.dict(exclude_unset=True), user_id=user_id)
+
+async def create_issue_in_db(issue_data, db: AsyncSession, user_id: str):
+    try:
+
+        data = issue_data.dict(exclude_unset=True)
+        # Assigned server-side so feed cursors never have to seek around back-dated rows
+        data["created_at"] = datetime.datetime.now(datetime.timezone.utc)
+        new_issue = Issue(**data, user_id=user_id)
 
         db.add(new_issue)
-        db.commit()
-        db.refresh(new_issue)
+        await db.commit()
+        await db.refresh(new_issue)
+        invalidate_feed_cache(new_issue)
+        location_directory.add(new_issue)
         return new_issue
     except Exception:
         raise HTTPException(
             status_code=500, detail="Failed to create issue. Please try again later.")
 
 
-def delete_issue_by_id(issue_id: str, user_id: str, db: Session):
+async def delete_issue_by_id(issue_id: str, user_id: str, db: AsyncSession):
     try:
-        issue = db.query(Issue).filter(Issue.id == issue_id,
-                                       Issue.user_id == user_id).first()
+        issue = (await db.execute(select(Issue).where(
+            Issue.id == issue_id, Issue.user_id == user_id))).scalars().first()
         if not issue:
             raise HTTPException(
                 status_code=404, detail="Issue not found or unauthorized.")
 
         issue.is_deleted = True
-        db.commit()
+        await db.commit()
+        invalidate_feed_cache(issue)
         return {"message": "Issue deleted successfully"}
     except HTTPException:
         raise
@@ -249,20 +502,24 @@ def delete_issue_by_id(issue_id: str, user_id: str, db: Session):
             status_code=500, detail="Failed to delete issue. Please try again later.")
 
 
-def update_issue_in_db(issue_id: str, issue_data, db: Session, user_id: str):
+async def update_issue_in_db(issue_id: str, issue_data, db: AsyncSession, user_id: str):
     try:
-        issue = db.query(Issue).filter(Issue.id == issue_id).first()
+        issue = (await db.execute(
+            select(Issue).where(Issue.id == issue_id))).scalars().first()
         if not issue:
             raise HTTPException(status_code=404, detail="Issue not found.")
         if str(issue.user_id) != user_id:
             raise HTTPException(
                 status_code=403, detail="User not authorized to update this issue.")
 
+        previous = SimpleNamespace(state=issue.state, district=issue.district, dept_id=issue.dept_id)
         for field, value in issue_data.dict(exclude_unset=True).items():
             setattr(issue, field, value)
 
-        db.commit()
-        db.refresh(issue)
+        await db.commit()
+        await db.refresh(issue)
+        invalidate_feed_cache(previous, issue)
+        location_directory.add(issue)
         return issue
     except HTTPException:
         raise
@@ -271,24 +528,36 @@ def update_issue_in_db(issue_id: str, issue_data, db: Session, user_id: str):
             status_code=500, detail="Failed to update issue. Please try again later.")
 
 
-async def get_issue_by_id(issue_id: str, db: Session):
+async def get_issue_owner_id(issue_id: str, db: AsyncSession) -> str:
+    """
+    Creator of a live issue, for ownership checks that need nothing else.
+
+    Unlike get_issue_by_id this skips the engagement stats and their
+    unique-viewer sketch.
+    """
+    owner_id = (await db.execute(select(Issue.user_id).where(
+        Issue.id == issue_id, Issue.is_deleted == False))).first()
+    if not owner_id:
+        raise HTTPException(status_code=404, detail="Issue not found.")
+    return str(owner_id.user_id)
+
+
+async def get_issue_by_id(issue_id: str, db: AsyncSession):
     try:
-        issue = db.query(Issue).filter(Issue.id == issue_id,
-                                        Issue.is_deleted == False).first()
-        
-        issue_views = await mdb.issue_views.count_documents({"issue_id": str(issue_id)})
-        issue_support = await mdb.issue_supports.count_documents({"issue_id": str(issue_id)})
-        issue_shares = await mdb.issue_shares.count_documents({"issue_id": str(issue_id)})
-        issue_likes = await mdb.issue_likes.count_documents({"issue_id": str(issue_id)})
+        issue = (await db.execute(select(Issue).where(
+            Issue.id == issue_id, Issue.is_deleted == False))).scalars().first()
         
         if not issue:
             raise HTTPException(status_code=404, detail="Issue not found.")
+
+        counts = await load_issue_stats(issue_id)
         return {
             "issue": issue,
-            "views": issue_views,
-            "supports": issue_support,
-            "shares": issue_shares,
-            "likes": issue_likes
+            "views": counts["views"],
+            "supports": counts["supports"],
+            "shares": counts["shares"],
+            "likes": counts["likes"],
+            "unique_viewers": counts["unique_viewers"]
         }
     except Exception:
         raise HTTPException(
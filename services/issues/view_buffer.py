@@ -0,0 +1,209 @@
+import asyncio
+import datetime
+import logging
+import os
+import time
+from bson import Binary
+from pymongo import UpdateOne
+from services.issues.engagement_services import bucket_operations
+from utils import mdb
+from utils.hll import HyperLogLog, hll_position
+
+VIEW_FLUSH_INTERVAL_MS = int(os.getenv("VIEW_FLUSH_INTERVAL_MS", 1000))
+VIEW_FLUSH_MAX_EVENTS = int(os.getenv("VIEW_FLUSH_MAX_EVENTS", 5000))
+VIEW_BUFFER_MAX_ISSUES = int(os.getenv("VIEW_BUFFER_MAX_ISSUES", 50000))
+
+
+class ViewBuffer:
+    """
+    Write-behind accumulator for issue view counts.
+
+    Views are coalesced per issue in memory and written to issue_stats with one
+    unordered bulk_write every VIEW_FLUSH_INTERVAL_MS, or sooner once
+    VIEW_FLUSH_MAX_EVENTS views are pending. At most VIEW_BUFFER_MAX_ISSUES
+    distinct issues are held; views for further issues are dropped and counted
+    until a flush frees room. The same cap applies to unique-viewer sketches
+    re-queued after a failed flush.
+
+    Each view also raises one register of the issue's unique-viewer HyperLogLog.
+    Only the touched registers are kept in memory; on flush they are merged into
+    the stored sketch with a version check, and re-queued if another worker won
+    the race (re-applying a register maximum is harmless).
+    """
+
+    def __init__(self, flush_interval_ms: int, flush_max_events: int, max_pending_issues: int):
+        self.flush_interval = flush_interval_ms / 1000
+        self.flush_max_events = flush_max_events
+        self.max_pending_issues = max_pending_issues
+        self._pending = {}
+        self._viewers = {}
+        self._pending_events = 0
+        self._oldest_pending = None
+        self._flush_lock = asyncio.Lock()
+        self._wake = asyncio.Event()
+        self._stopping = False
+        self._task = None
+
+        self.flushes = 0
+        self.failed_flushes = 0
+        self.flushed_events = 0
+        self.dropped_events = 0
+        self.dropped_sketches = 0
+        self.last_flush_lag = 0.0
+        self.max_flush_lag = 0.0
+
+    def add(self, issue_id: str, viewer: str | None = None):
+        if issue_id not in self._pending and len(self._pending) >= self.max_pending_issues:
+            self.dropped_events += 1
+            self._wake.set()
+            return
+        self._pending[issue_id] = self._pending.get(issue_id, 0) + 1
+        if viewer:
+            self._raise_registers(issue_id, (hll_position(viewer),))
+        self._pending_events += 1
+        if self._oldest_pending is None:
+            self._oldest_pending = time.monotonic()
+        if self._pending_events >= self.flush_max_events:
+            self._wake.set()
+
+    def _raise_registers(self, issue_id: str, positions):
+        registers = self._viewers.setdefault(issue_id, {})
+        for index, rank in positions:
+            if rank > registers.get(index, 0):
+                registers[index] = rank
+
+    def _requeue_viewers(self, viewers: dict, dropped_issues=()):
+        """
+        Put unmerged registers back for the next flush under the same
+        VIEW_BUFFER_MAX_ISSUES cap as the counts. Sketches of issues whose counts
+        were dropped, or that no longer fit, are dropped too.
+        """
+        for issue_id, registers in viewers.items():
+            if issue_id not in dropped_issues and (
+                    issue_id in self._viewers or len(self._viewers) < self.max_pending_issues):
+                self._raise_registers(issue_id, registers.items())
+            else:
+                self.dropped_sketches += 1
+
+    async def _merge_viewers(self, viewers: dict):
+        docs = mdb.issue_stats.find(
+            {"_id": {"$in": list(viewers)}}, {"viewer_hll": 1, "viewer_hll_version": 1})
+        stored = {doc["_id"]: doc async for doc in docs}
+
+        operations = []
+        for issue_id, registers in viewers.items():
+            doc = stored.get(issue_id, {})
+            sketch = HyperLogLog(doc["viewer_hll"]) if doc.get("viewer_hll") else HyperLogLog()
+            changed = False
+            for index, rank in registers.items():
+                changed = sketch.update(index, rank) or changed
+            if not changed:
+                continue
+            operations.append(UpdateOne(
+                {"_id": issue_id, "viewer_hll_version": doc.get("viewer_hll_version")},
+                {"$set": {"viewer_hll": Binary(sketch.to_bytes())}, "$inc": {"viewer_hll_version": 1}},
+            ))
+        if not operations:
+            return
+
+        result = await mdb.issue_stats.bulk_write(operations, ordered=False)
+        if result.matched_count < len(operations):
+            # Some sketch moved underneath us; retry every register on the next flush
+            self._requeue_viewers(viewers)
+
+    async def flush(self):
+        async with self._flush_lock:
+            if not self._pending and not self._viewers:
+                return
+            pending, viewers, oldest = self._pending, self._viewers, self._oldest_pending
+            events = self._pending_events
+            self._pending, self._viewers, self._pending_events, self._oldest_pending = {}, {}, 0, None
+
+            if pending:
+                operations = [
+                    UpdateOne({"_id": issue_id}, {"$inc": {"views": count}}, upsert=True)
+                    for issue_id, count in pending.items()
+                ]
+                # Buffered views land in the bucket of the flush, at most one interval late
+                flushed_at = datetime.datetime.utcnow()
+                bucket_updates = [
+                    operation
+                    for issue_id, count in pending.items()
+                    for operation in bucket_operations(issue_id, {"views": count}, flushed_at)
+                ]
+                try:
+                    await asyncio.gather(
+                        mdb.issue_stats.bulk_write(operations, ordered=False),
+                        mdb.engagement_buckets.bulk_write(bucket_updates, ordered=False),
+                    )
+                except Exception as e:
+                    logging.exception("Failed to flush %s buffered views: %s", events, e)
+                    self.failed_flushes += 1
+                    # Put the counts back; they are retried with the next flush
+                    dropped_issues = set()
+                    for issue_id, count in pending.items():
+                        if issue_id in self._pending or len(self._pending) < self.max_pending_issues:
+                            self._pending[issue_id] = self._pending.get(issue_id, 0) + count
+                            self._pending_events += count
+                        else:
+                            self.dropped_events += count
+                            dropped_issues.add(issue_id)
+                    if self._pending:
+                        self._oldest_pending = min(oldest, self._oldest_pending or oldest)
+                    self._requeue_viewers(viewers, dropped_issues)
+                    return
+
+                self.flushes += 1
+                self.flushed_events += events
+                self.last_flush_lag = time.monotonic() - oldest
+                self.max_flush_lag = max(self.max_flush_lag, self.last_flush_lag)
+
+            if viewers:
+                try:
+                    await self._merge_viewers(viewers)
+                except Exception as e:
+                    logging.exception("Failed to merge unique viewer sketches: %s", e)
+                    self._requeue_viewers(viewers)
+
+    async def _run(self):
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    def start(self):
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            # Let an in-flight flush finish: cancelling it mid-write would skip the
+            # re-queue on failure and lose the views it had already taken
+            self._stopping = True
+            self._wake.set()
+            await self._task
+            self._task = None
+        await self.flush()
+
+    def snapshot(self) -> dict:
+        pending_age = time.monotonic() - self._oldest_pending if self._oldest_pending else 0.0
+        return {
+            "pending_issues": len(self._pending),
+            "pending_sketches": len(self._viewers),
+            "pending_events": self._pending_events,
+            "oldest_pending_ms": round(pending_age * 1000, 3),
+            "last_flush_lag_ms": round(self.last_flush_lag * 1000, 3),
+            "max_flush_lag_ms": round(self.max_flush_lag * 1000, 3),
+            "flushes": self.flushes,
+            "failed_flushes": self.failed_flushes,
+            "flushed_events": self.flushed_events,
+            "dropped_events": self.dropped_events,
+            "dropped_sketches": self.dropped_sketches,
+        }
+
+
+view_buffer = ViewBuffer(VIEW_FLUSH_INTERVAL_MS, VIEW_FLUSH_MAX_EVENTS, VIEW_BUFFER_MAX_ISSUES)
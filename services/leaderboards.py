@@ -0,0 +1,70 @@
+import asyncio
+import logging
+import os
+import time
+from sqlalchemy import text
+from models.leaderboards import LEADERBOARD_VIEWS
+from services.official_rankings import rebuild_official_rank_snapshots
+from utils.db import async_engine
+
+LEADERBOARD_REFRESH_SECONDS = float(os.getenv("LEADERBOARD_REFRESH_SECONDS", 300))
+# Arbitrary key so only one worker refreshes a given round
+LEADERBOARD_REFRESH_LOCK_ID = 72130432
+
+
+async def refresh_leaderboards() -> bool:
+    """
+    Refresh every leaderboard view concurrently, so readers are never blocked,
+    and rebuild the rolling-window official rank snapshots.
+
+    :return: False when another worker already holds the refresh lock.
+    """
+    async with async_engine.begin() as conn:
+        locked = await conn.scalar(
+            text("SELECT pg_try_advisory_xact_lock(:id)"), {"id": LEADERBOARD_REFRESH_LOCK_ID})
+        if not locked:
+            return False
+        # Rebuilding a view can outlast the per-request statement timeout
+        await conn.execute(text("SET LOCAL statement_timeout = 0"))
+        for view in LEADERBOARD_VIEWS:
+            await conn.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view.name}"))
+        await rebuild_official_rank_snapshots(conn)
+    return True
+
+
+class LeaderboardRefresher:
+    """Background task that refreshes the leaderboards every LEADERBOARD_REFRESH_SECONDS."""
+
+    def __init__(self, refresh_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self._task = None
+        self.refreshes = 0
+        self.last_refresh_ms = 0.0
+
+    async def _run(self):
+        # Refresh right away: official_rank_snapshots starts out empty after a deploy
+        while True:
+            started = time.perf_counter()
+            try:
+                if await refresh_leaderboards():
+                    self.refreshes += 1
+                    self.last_refresh_ms = round((time.perf_counter() - started) * 1000, 3)
+            except Exception as e:
+                logging.exception("Failed to refresh leaderboard views: %s", e)
+            await asyncio.sleep(self.refresh_seconds)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+leaderboard_refresher = LeaderboardRefresher(LEADERBOARD_REFRESH_SECONDS)
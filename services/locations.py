@@ -0,0 +1,70 @@
+import asyncio
+import logging
+import os
+import time
+from sqlalchemy import select
+from models.issue import Issue
+from utils.db import AsyncSessionLocal
+from utils.location_index import LocationIndex
+
+# Other workers' new locations are picked up on the next rebuild
+LOCATION_INDEX_REBUILD_SECONDS = float(os.getenv("LOCATION_INDEX_REBUILD_SECONDS", 600))
+
+
+class LocationDirectory:
+    """
+    Holds the live LocationIndex and keeps it current.
+
+    The index is built from the distinct locations of live issues at startup
+    and rebuilt every LOCATION_INDEX_REBUILD_SECONDS; issues created or edited
+    by this worker are added as they happen.
+    """
+
+    def __init__(self, rebuild_seconds: float):
+        self.rebuild_seconds = rebuild_seconds
+        self.index = LocationIndex()
+        self._task = None
+        self.last_build_ms = 0.0
+
+    async def rebuild(self):
+        started = time.perf_counter()
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(
+                select(Issue.state, Issue.district, Issue.taluk, Issue.village)
+                .where(Issue.is_deleted == False)
+                .distinct()
+            )).all()
+        # Sorting a large index takes long enough that it should not block the event loop
+        self.index = await asyncio.to_thread(LocationIndex.build, rows)
+        self.last_build_ms = round((time.perf_counter() - started) * 1000, 3)
+
+    def add(self, issue):
+        self.index.add(issue.state, issue.district, issue.taluk, issue.village)
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.rebuild_seconds)
+            try:
+                await self.rebuild()
+            except Exception as e:
+                logging.exception("Failed to rebuild the location index: %s", e)
+
+    async def start(self):
+        if self._task is None:
+            try:
+                await self.rebuild()
+            except Exception as e:
+                logging.exception("Failed to build the location index: %s", e)
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+location_directory = LocationDirectory(LOCATION_INDEX_REBUILD_SECONDS)
@@ -0,0 +1,141 @@
+import uuid
+from fastapi import HTTPException
+from sqlalchemy import select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from models.official_rank_snapshot import OfficialRankSnapshot
+from utils.pagination import decode_cursor, encode_cursor
+
+# Rolling windows, in days, that officials are ranked over
+RANKING_PERIODS = {"week": 7, "month": 30}
+
+_REBUILD_SNAPSHOT = text("""
+    WITH window_stats AS (
+        SELECT employee_id,
+               count(*) AS issue_count,
+               count(*) FILTER (WHERE current_status = 'Resolved') AS resolved_count
+        FROM issues
+        WHERE is_deleted = false
+          AND employee_id IS NOT NULL
+          AND created_at >= now() - make_interval(days => :days)
+        GROUP BY employee_id
+    ), scored AS (
+        SELECT e.id AS employee_id, e.fullname, e.state, e.district,
+               COALESCE(s.issue_count, 0) AS issue_count,
+               COALESCE(s.resolved_count, 0) AS resolved_count,
+               COALESCE(e.good_count, 0) - COALESCE(e.false_count, 0) AS standing
+        FROM employees e
+        LEFT JOIN window_stats s ON s.employee_id = e.id
+    )
+    INSERT INTO official_rank_snapshots (
+        period, employee_id, fullname, state, district, issue_count, resolved_count, score,
+        overall_rank, state_rank, district_rank, computed_at)
+    SELECT :period, employee_id, fullname, state, district, issue_count, resolved_count, resolved_count,
+           RANK() OVER (ORDER BY resolved_count DESC, issue_count DESC, standing DESC),
+           RANK() OVER (PARTITION BY state ORDER BY resolved_count DESC, issue_count DESC, standing DESC),
+           RANK() OVER (PARTITION BY state, district
+                        ORDER BY resolved_count DESC, issue_count DESC, standing DESC),
+           now()
+    FROM scored
+""")
+
+
+async def rebuild_official_rank_snapshots(conn: AsyncConnection):
+    """
+    Recompute every ranking period inside the caller's transaction.
+
+    The window applies to when an issue was raised: issue_count is the
+    official's issues created within the window, and resolved_count those of
+    them whose current_status is 'Resolved' now. Older issues resolved during
+    the window do not count, since issues record no resolution time. Officials
+    are ranked by resolved_count, then issue_count, then their lifetime
+    good_count - false_count; ties share a rank.
+
+    Nothing in this service assigns issues.employee_id; it must be populated
+    outside the app. Until it is, every official is 0/0 and only the lifetime
+    counts separate them.
+    Readers keep seeing the previous snapshot until the transaction commits.
+    """
+    for period, days in RANKING_PERIODS.items():
+        await conn.execute(
+            text("DELETE FROM official_rank_snapshots WHERE period = :period"), {"period": period})
+        await conn.execute(_REBUILD_SNAPSHOT, {"period": period, "days": days})
+
+
+def _rank_column(state: str | None, district: str | None):
+    if district:
+        return OfficialRankSnapshot.district_rank
+    if state:
+        return OfficialRankSnapshot.state_rank
+    return OfficialRankSnapshot.overall_rank
+
+
+def _serialize(row: OfficialRankSnapshot, rank: int) -> dict:
+    return {
+        "employee_id": row.employee_id,
+        "fullname": row.fullname,
+        "state": row.state,
+        "district": row.district,
+        "issue_count": row.issue_count,
+        "resolved_count": row.resolved_count,
+        "score": row.score,
+        "rank": rank,
+        "computed_at": row.computed_at,
+    }
+
+
+async def get_official_leaderboard(
+    db: AsyncSession,
+    period: str,
+    cursor: str | None,
+    limit: int,
+    state: str | None = None,
+    district: str | None = None
+):
+    """
+    Page through one period's ranking, optionally scoped to a state or district.
+
+    :return: {"officials": [...], "next_cursor": str | None}
+    """
+    if period not in RANKING_PERIODS:
+        raise HTTPException(status_code=400, detail="Unknown ranking period.")
+    if district and not state:
+        raise HTTPException(status_code=400, detail="district requires state.")
+
+    rank_column = _rank_column(state, district)
+    query = select(OfficialRankSnapshot).where(OfficialRankSnapshot.period == period)
+    if state:
+        query = query.where(OfficialRankSnapshot.state == state)
+    if district:
+        query = query.where(OfficialRankSnapshot.district == district)
+    if cursor:
+        cursor_rank, cursor_id = decode_cursor(cursor, int, uuid.UUID)
+        query = query.where(
+            tuple_(rank_column, OfficialRankSnapshot.employee_id) > tuple_(cursor_rank, cursor_id))
+
+    rows = (await db.execute(
+        query.order_by(rank_column, OfficialRankSnapshot.employee_id).limit(limit + 1)
+    )).scalars().all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(getattr(rows[-1], rank_column.key), rows[-1].employee_id)
+
+    return {
+        "officials": [_serialize(row, getattr(row, rank_column.key)) for row in rows],
+        "next_cursor": next_cursor,
+    }
+
+
+async def get_official_rank(db: AsyncSession, employee_id: uuid.UUID, period: str):
+    """
+    Look up one official's ranks for a period by primary key.
+    """
+    if period not in RANKING_PERIODS:
+        raise HTTPException(status_code=400, detail="Unknown ranking period.")
+    row = await db.get(OfficialRankSnapshot, (period, employee_id))
+    if not row:
+        raise HTTPException(status_code=404, detail="Official not ranked yet.")
+    ranked = _serialize(row, row.overall_rank)
+    ranked.update(state_rank=row.state_rank, district_rank=row.district_rank)
+    return ranked
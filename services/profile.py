@@ -1,9 +1,25 @@
+import datetime
+import os
+import uuid
 from fastapi import HTTPException
 from fastapi.params import Depends
 from fastapi.responses import JSONResponse
+from models.follow import FOLLOW_TARGET_TYPES, Follow
 from models.profile import Profile
 from utils.db import get_db
-from sqlalchemy.orm.attributes import flag_modified
+from utils.pagination import decode_cursor, encode_cursor
+from sqlalchemy import delete, select, true, tuple_
+from sqlalchemy.dialects.postgresql import insert
+
+FOLLOW_PAGE_SIZE = int(os.getenv("FOLLOW_PAGE_SIZE", 20))
+
+# Legacy profile fields, now backed by the follows table
+FOLLOWING_FIELDS = {
+    "following_users": "user",
+    "following_issues": "issue",
+    "following_depts": "dept",
+    "following_locations": "location",
+}
 
 
 def onboard_service(user_data, user_id, db):
@@ -17,16 +33,15 @@ def onboard_service(user_data, user_id, db):
         data = Profile(
             user_id=user_id,
             fullname=user_data.fullname,
-            role=user_data.role,
-            following_users=user_data.following_users or [],
-            following_issues=user_data.following_issues or [],
-            following_depts=user_data.following_depts or [],
-            following_locations=user_data.following_locations or []
+            role=user_data.role
         )
         db.add(data)
+        _replace_follows(user_id, {field: getattr(user_data, field) or [] for field in FOLLOWING_FIELDS}, db)
         db.commit()
         db.refresh(data)
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail="Database error: " + str(e))
@@ -40,8 +55,14 @@ def get_profile_service(user_id, db):
         if not profile:
             raise HTTPException(status_code=404, detail="Profile not found")
 
-        return profile
+        # The following_* columns are no longer maintained; serve the follows table instead
+        return {
+            **{column.name: getattr(profile, column.name) for column in Profile.__table__.columns},
+            **get_following_service(user_id, db),
+        }
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail="Database error: " + str(e))
@@ -53,58 +74,182 @@ def update_profile_service(user_data, user_id, db):
         if not profile:
             raise HTTPException(status_code=404, detail="Profile not found")
 
-        for key, value in user_data.dict(exclude_unset=True).items():
+        updates = user_data.dict(exclude_unset=True)
+        following = {field: updates.pop(field) for field in FOLLOWING_FIELDS if field in updates}
+        for key, value in updates.items():
             setattr(profile, key, value)
+        _replace_follows(user_id, following, db)
 
         db.commit()
         db.refresh(profile)
 
         return JSONResponse(content="Profile updated successfully", status_code=200)
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail="Database error: " + str(e))
         
-def get_following_service(user_id, db):
+def _normalize_target(target_type, target_id):
+    if target_type not in FOLLOW_TARGET_TYPES:
+        raise HTTPException(status_code=400, detail="Unknown follow target type")
+    if target_type == "location":
+        target_id = " ".join(str(target_id).split())
+        if not target_id:
+            raise HTTPException(status_code=400, detail="Location is required")
+        return target_id
     try:
-        profile = db.query(Profile).filter(Profile.user_id == user_id).first()
-        if not profile:
-            raise HTTPException(status_code=404, detail="Profile not found")
+        return str(uuid.UUID(str(target_id)))
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid {target_type} ID")
+
+
+def _follow(user_id, target_type, target_id, db):
+    db.execute(
+        insert(Follow)
+        .values(follower_id=user_id, target_type=target_type,
+                target_id=_normalize_target(target_type, target_id))
+        .on_conflict_do_nothing()
+    )
+    db.commit()
+
+
+def _unfollow(user_id, target_type, target_id, db):
+    db.execute(delete(Follow).where(
+        Follow.follower_id == user_id,
+        Follow.target_type == target_type,
+        Follow.target_id == _normalize_target(target_type, target_id)))
+    db.commit()
+
+
+def _listed_targets(target_type, entries):
+    """
+    Canonical target IDs from an onboarding or profile-update list.
+
+    Entries are plain IDs or objects carrying an "id". Anything else, and IDs
+    that do not normalize, is skipped, exactly as migration 0009 skipped them
+    when copying the legacy JSON arrays.
+    """
+    targets = set()
+    for entry in entries:
+        target_id = entry.get("id") if isinstance(entry, dict) else entry
+        if not isinstance(target_id, str) or not target_id.strip():
+            continue
+        try:
+            targets.add(_normalize_target(target_type, target_id.strip()))
+        except HTTPException:
+            continue
+    return targets
+
+
+def _replace_follows(user_id, following, db):
+    """Make the user's follows of each given type exactly the listed targets."""
+    for field, target_type in FOLLOWING_FIELDS.items():
+        if following.get(field) is None:
+            continue
+        targets = _listed_targets(target_type, following[field])
+        db.execute(delete(Follow).where(
+            Follow.follower_id == user_id,
+            Follow.target_type == target_type,
+            Follow.target_id.notin_(list(targets)) if targets else true()))
+        if targets:
+            db.execute(
+                insert(Follow)
+                .values([{"follower_id": user_id, "target_type": target_type, "target_id": target}
+                         for target in targets])
+                .on_conflict_do_nothing()
+            )
 
-        following_users = profile.following_users if profile.following_users else []
-        following_issues = profile.following_issues if profile.following_issues else []
-        following_depts = profile.following_depts if profile.following_depts else []
-        following_locations = profile.following_locations if profile.following_locations else []
-        
-        return {
-            "following_users": following_users,
-            "following_issues": following_issues,
-            "following_depts": following_depts,
-            "following_locations": following_locations
-        }
+
+def get_following_service(user_id, db):
+    try:
+        following = {field: [] for field in FOLLOWING_FIELDS}
+        fields_by_type = {target_type: field for field, target_type in FOLLOWING_FIELDS.items()}
+        rows = db.execute(
+            select(Follow.target_type, Follow.target_id, Follow.created_at)
+            .where(Follow.follower_id == user_id)
+            .order_by(Follow.target_type, Follow.created_at, Follow.target_id)
+        ).all()
+        # Objects, as onboarding sends them and ProfileBase declares them
+        for target_type, target_id, created_at in rows:
+            if target_type in fields_by_type:
+                following[fields_by_type[target_type]].append({"id": target_id, "followed_at": created_at})
+
+        return following
 
     except Exception as e:
         raise HTTPException(
             status_code=500, detail="Database error: " + str(e))
-        
 
-def add_following_user(user_id, following_user_id, db):
-    try:
-        profile = db.query(Profile).filter(Profile.user_id == user_id).first()
-        if not profile:
-            raise HTTPException(status_code=404, detail="Profile not found")
 
-        if profile.following_users is None:
-            profile.following_users = []
+def list_following_service(user_id, target_type, db, cursor=None, limit=FOLLOW_PAGE_SIZE):
+    """
+    Page through the targets of one type that a user follows, newest first.
+
+    :return: {"following": [{"target_id", "followed_at"}], "next_cursor": str | None}
+    """
+    if target_type not in FOLLOW_TARGET_TYPES:
+        raise HTTPException(status_code=400, detail="Unknown follow target type")
+
+    query = select(Follow.target_id, Follow.created_at).where(
+        Follow.follower_id == user_id, Follow.target_type == target_type)
+    if cursor:
+        created_at, target_id = decode_cursor(cursor, datetime.datetime.fromisoformat, str)
+        query = query.where(tuple_(Follow.created_at, Follow.target_id) < tuple_(created_at, target_id))
+    rows = db.execute(
+        query.order_by(Follow.created_at.desc(), Follow.target_id.desc()).limit(limit + 1)
+    ).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].target_id)
+    return {
+        "following": [{"target_id": row.target_id, "followed_at": row.created_at} for row in rows],
+        "next_cursor": next_cursor,
+    }
+
+
+def list_followers_service(target_type, target_id, db, cursor=None, limit=FOLLOW_PAGE_SIZE):
+    """
+    Page through the users following a target, newest first.
+
+    :return: {"followers": [{"user_id", "fullname", "followed_at"}], "next_cursor": str | None}
+    """
+    target_id = _normalize_target(target_type, target_id)
+    query = (
+        select(Follow.follower_id, Follow.created_at, Profile.fullname)
+        .outerjoin(Profile, Profile.user_id == Follow.follower_id)
+        .where(Follow.target_type == target_type, Follow.target_id == target_id)
+    )
+    if cursor:
+        created_at, follower_id = decode_cursor(cursor, datetime.datetime.fromisoformat, uuid.UUID)
+        query = query.where(tuple_(Follow.created_at, Follow.follower_id) < tuple_(created_at, follower_id))
+    rows = db.execute(
+        query.order_by(Follow.created_at.desc(), Follow.follower_id.desc()).limit(limit + 1)
+    ).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].follower_id)
+    return {
+        "followers": [
+            {"user_id": row.follower_id, "fullname": row.fullname, "followed_at": row.created_at}
+            for row in rows
+        ],
+        "next_cursor": next_cursor,
+    }
 
-        if following_user_id not in profile.following_users:
-            profile.following_users.append(following_user_id)
-            flag_modified(profile, "following_users")
-            db.commit()
-            db.refresh(profile)
 
+def add_following_user(user_id, following_user_id, db):
+    try:
+        _follow(user_id, "user", following_user_id, db)
         return JSONResponse(content="Following user added successfully", status_code=200)
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail="Database error: " + str(e))
@@ -112,135 +257,77 @@ def add_following_user(user_id, following_user_id, db):
 
 def remove_following_user(user_id, following_user_id, db):
     try:
-        profile = db.query(Profile).filter(Profile.user_id == user_id).first()
-        if not profile:
-            raise HTTPException(status_code=404, detail="Profile not found")
-
-        if profile.following_users and following_user_id in profile.following_users:
-            profile.following_users.remove(following_user_id)
-            flag_modified(profile, "following_users")
-            db.commit()
-            db.refresh(profile)
-
+        _unfollow(user_id, "user", following_user_id, db)
         return JSONResponse(content="Following user removed successfully", status_code=200)
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail="Database error: " + str(e))
         
 def add_following_issue(user_id, issue_id, db):
     try:
-        profile = db.query(Profile).filter(Profile.user_id == user_id).first()
-        if not profile:
-            raise HTTPException(status_code=404, detail="Profile not found")
-
-        if profile.following_issues is None:
-            profile.following_issues = []
-            
-        if issue_id not in profile.following_issues:
-            profile.following_issues.append(issue_id)
-            flag_modified(profile, "following_issues")
-            db.commit()
-            db.refresh(profile)
-
+        _follow(user_id, "issue", issue_id, db)
         return JSONResponse(content="Following issue added successfully", status_code=200)
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail="Database error: " + str(e))
         
 def remove_following_issue(user_id, issue_id, db):
     try:
-        profile = db.query(Profile).filter(Profile.user_id == user_id).first()
-        if not profile:
-            raise HTTPException(status_code=404, detail="Profile not found")
-
-        if profile.following_issues and issue_id in profile.following_issues:
-            profile.following_issues.remove(issue_id)
-            flag_modified(profile, "following_issues")
-            db.commit()
-            db.refresh(profile)
-
+        _unfollow(user_id, "issue", issue_id, db)
         return JSONResponse(content="Following issue removed successfully", status_code=200)
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail="Database error: " + str(e))
         
 def add_following_dept(user_id, dept_id, db):
     try:
-        profile = db.query(Profile).filter(Profile.user_id == user_id).first()
-        if not profile:
-            raise HTTPException(status_code=404, detail="Profile not found")
-
-        if profile.following_depts is None:
-            profile.following_depts = []
-
-        if dept_id not in profile.following_depts:
-            profile.following_depts.append(dept_id)
-            flag_modified(profile, "following_depts")
-            db.commit()
-            db.refresh(profile)
-
+        _follow(user_id, "dept", dept_id, db)
         return JSONResponse(content="Following department added successfully", status_code=200)
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail="Database error: " + str(e))
         
 def remove_following_dept(user_id, dept_id, db):
     try:
-        profile = db.query(Profile).filter(Profile.user_id == user_id).first()
-        if not profile:
-            raise HTTPException(status_code=404, detail="Profile not found")
-
-        if profile.following_depts and dept_id in profile.following_depts:
-            profile.following_depts.remove(dept_id)
-            flag_modified(profile, "following_depts")
-            db.commit()
-            db.refresh(profile)
-
+        _unfollow(user_id, "dept", dept_id, db)
         return JSONResponse(content="Following department removed successfully", status_code=200)
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail="Database error: " + str(e))
         
 def add_following_location(user_id, location_id, db):
     try:
-        profile = db.query(Profile).filter(Profile.user_id == user_id).first()
-        if not profile:
-            raise HTTPException(status_code=404, detail="Profile not found")
-
-        if profile.following_locations is None:
-            profile.following_locations = []
-
-        if location_id not in profile.following_locations:
-            profile.following_locations.append(location_id)
-            flag_modified(profile, "following_locations")
-            db.commit()
-            db.refresh(profile)
-
+        _follow(user_id, "location", location_id, db)
         return JSONResponse(content="Following location added successfully", status_code=200)
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail="Database error: " + str(e))
         
 def remove_following_location(user_id, location_id, db):
     try:
-        profile = db.query(Profile).filter(Profile.user_id == user_id).first()
-        if not profile:
-            raise HTTPException(status_code=404, detail="Profile not found")
-
-        if profile.following_locations and location_id in profile.following_locations:
-            profile.following_locations.remove(location_id)
-            flag_modified(profile, "following_locations")
-            db.commit()
-            db.refresh(profile)
-
+        _unfollow(user_id, "location", location_id, db)
         return JSONResponse(content="Following location removed successfully", status_code=200)
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail="Database error: " + str(e))
\ No newline at end of file
@@ -1,64 +1,117 @@
 import datetime
+import os
+import uuid
+from utils.pagination import decode_cursor, encode_cursor
+
+SAVES_PAGE_SIZE = int(os.getenv("SAVES_PAGE_SIZE", 20))
+
+# Unsave if the row exists, otherwise save it. Both branches see the same
+# snapshot, so the insert only runs when nothing was deleted; foreign keys
+# reject unknown issues and users.
+_TOGGLE_SAVE = """
+WITH removed AS (
+    DELETE FROM saves WHERE issue_id = :issue_id AND user_id = :user_id
+    RETURNING issue_id
+), inserted AS (
+    INSERT INTO saves (issue_id, user_id, created_at)
+    SELECT :issue_id, :user_id, now()
+    WHERE NOT EXISTS (SELECT 1 FROM removed)
+    ON CONFLICT DO NOTHING
+    RETURNING issue_id
+)
+SELECT (SELECT count(*) FROM removed) AS removed, (SELECT count(*) FROM inserted) AS inserted
+"""
+
+# PostgreSQL foreign_key_violation
+FOREIGN_KEY_VIOLATION = "23503"
+# Name Postgres gives the saves.user_id foreign key (no naming convention is set)
+SAVES_USER_FOREIGN_KEY = "saves_user_id_fkey"
 
 
 def save_issue_service(issue_id, user_id, db):
     """
-    
+    Save an issue for a user, or unsave it if it is already saved, in one statement.
+
     :param issue_id: UUID of the issue to save or unsave.
     :param user_id: UUID of the user performing the action.
     :param db: Database session.
     :return: Success message or error message.
     """
-    from models.save import Save  # Import here to avoid circular dependency
+    from sqlalchemy import text
     from sqlalchemy.exc import IntegrityError
 
     try:
-        from models.issue import Issue  # Import here to avoid circular dependency
-        from models.user import User  # Import here to avoid circular dependency
-        
-        found = db.query(Save).filter(Save.issue_id == issue_id, Save.user_id == user_id).first()
-        if found:
-            db.delete(found)
-            db.commit()
-            return {"error": "Issue unsaved."}
+        issue_id = uuid.UUID(str(issue_id))
+    except ValueError:
+        return {"error": "Issue not found."}
 
-        issue = db.query(Issue).filter(Issue.id == issue_id).first()
-        if not issue:
-            return {"error": "Issue not found."}
-
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            return {"error": "User not found."}
+    try:
+        user_id = uuid.UUID(str(user_id))
+    except ValueError:
+        return {"error": "User not found."}
 
-        save = Save(issue_id=issue_id, user_id=user_id, created_at=datetime.datetime.utcnow())
-        db.add(save)
+    try:
+        toggled = db.execute(text(_TOGGLE_SAVE), {"issue_id": issue_id, "user_id": user_id}).one()
         db.commit()
+        if toggled.removed:
+            return {"error": "Issue unsaved."}
+        if not toggled.inserted:
+            # A concurrent request saved it between our snapshot and the insert
+            return {"error": "Issue already saved by user."}
         return {"message": "Issue saved successfully."}
-    except IntegrityError:
+    except IntegrityError as e:
         db.rollback()
+        if getattr(e.orig, "pgcode", None) == FOREIGN_KEY_VIOLATION:
+            constraint = getattr(getattr(e.orig, "diag", None), "constraint_name", None)
+            if constraint == SAVES_USER_FOREIGN_KEY:
+                return {"error": "User not found."}
+            return {"error": "Issue not found."}
         return {"error": "Issue already saved by user."}
     except Exception as e:
         db.rollback()
         return {"error": str(e)}
     
-def get_saves_service(user_id, db):
+def get_saves_service(user_id, db, cursor=None, limit=SAVES_PAGE_SIZE):
     """
-    Retrieve all saved issues for a user.
+    Page through a user's saved issues, most recently saved first.
 
     :param user_id: UUID of the user.
     :param db: Database session.
-    :return: List of saved issues or error message.
+    :param cursor: Cursor from the previous page, if any.
+    :param limit: Number of issues per page.
+    :return: Saved issues and the next cursor, or error message.
     """
+    from fastapi import HTTPException
+    from sqlalchemy import select, tuple_
     from models.save import Save  # Import here to avoid circular dependency
     from models.issue import Issue  # Import here to avoid circular dependency
 
     try:
-        saves = db.query(Save).filter(Save.user_id == user_id).all()
-        if not saves:
+        query = (
+            select(Issue, Save.created_at.label("saved_at"))
+            .join(Save, Save.issue_id == Issue.id)
+            .where(Save.user_id == user_id, Issue.is_deleted == False)
+        )
+        if cursor:
+            saved_at, issue_id = decode_cursor(cursor, datetime.datetime.fromisoformat, uuid.UUID)
+            query = query.where(tuple_(Save.created_at, Save.issue_id) < tuple_(saved_at, issue_id))
+        rows = db.execute(
+            query.order_by(Save.created_at.desc(), Save.issue_id.desc()).limit(limit + 1)
+        ).all()
+        if not rows and not cursor:
             return {"message": "No saved issues found."}
 
-        saved_issues = [db.query(Issue).filter(Issue.id == save.issue_id).first() for save in saves]
-        return {"saved_issues": saved_issues}
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].saved_at, rows[-1].Issue.id)
+
+        return {
+            "saved_issues": [row.Issue for row in rows],
+            "next_cursor": next_cursor,
+        }
+    except HTTPException:
+        raise
     except Exception as e:
         return {"error": str(e)}
     
@@ -71,14 +124,14 @@ def unsave_issue_service(issue_id, user_id, db):
     :param db: Database session.
     :return: Success message or error message.
     """
+    from sqlalchemy import delete
     from models.save import Save  # Import here to avoid circular dependency
 
     try:
-        save = db.query(Save).filter(Save.issue_id == issue_id, Save.user_id == user_id).first()
-        if not save:
+        removed = db.execute(delete(Save).where(Save.issue_id == issue_id, Save.user_id == user_id))
+        if not removed.rowcount:
             return {"error": "Save not found."}
 
-        db.delete(save)
         db.commit()
         return {"message": "Issue unsaved successfully."}
     except Exception as e:
@@ -1,11 +1,63 @@
 import datetime
+import os
+import uuid
 from models.thread import Thread
-from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, tuple_
 from fastapi import HTTPException
 from utils.mdb import thread_supports
+from utils.pagination import decode_cursor, encode_cursor
 
-async def fetch_threads_by_issue_id(issue_id: str, user_id: str, db: Session):
+THREAD_PAGE_SIZE = int(os.getenv("THREAD_PAGE_SIZE", 20))
+
+def normalize_thread_id(thread_id) -> str:
+    """Canonical string form under which thread supports are stored and queried."""
+    try:
+        return str(uuid.UUID(str(thread_id)))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid thread ID.")
+
+
+async def load_thread_supports(thread_ids: list, user_id: str | None) -> dict:
+    """
+    Count supports for a page of threads and flag the viewer's own, in one
+    $facet aggregation over the page's thread IDs.
+
+    :return: Mapping of thread ID (str) to {"supports": int, "is_supported": bool}.
+    """
+    thread_ids = [normalize_thread_id(thread_id) for thread_id in thread_ids]
+    if not thread_ids:
+        return {}
+
+    pipeline = [
+        {"$match": {"thread_id": {"$in": thread_ids}}},
+        {"$facet": {
+            "counts": [{"$group": {"_id": "$thread_id", "supports": {"$sum": 1}}}],
+            "viewer": [{"$match": {"user_id": str(user_id)}}, {"$project": {"_id": 0, "thread_id": 1}}],
+        }},
+    ]
+    facets = await thread_supports.aggregate(pipeline).to_list(length=1)
+    facets = facets[0] if facets else {"counts": [], "viewer": []}
+    counts = {row["_id"]: row["supports"] for row in facets["counts"]}
+    supported = {row["thread_id"] for row in facets["viewer"]} if user_id else set()
+
+    return {
+        thread_id: {"supports": counts.get(thread_id, 0), "is_supported": thread_id in supported}
+        for thread_id in thread_ids
+    }
+
+
+async def fetch_threads_by_issue_id(
+    issue_id: str,
+    user_id: str,
+    db: AsyncSession,
+    cursor: str | None = None,
+    limit: int = THREAD_PAGE_SIZE
+):
+    """
+    Page through an issue's threads, newest first, with support counts and the
+    viewer's support flag.
+    """
     try:
         if not issue_id:
             raise HTTPException(
@@ -16,19 +68,34 @@ async def fetch_threads_by_issue_id(issue_id: str, user_id: str, db: Session):
         stmt = select(Thread).where(
             Thread.issue_id == issue_id,
             Thread.is_deleted == False
-        ).order_by(Thread.created_at.desc())
-
-        result = db.execute(stmt)
+        )
+        if cursor:
+            cursor_created_at, cursor_id = decode_cursor(
+                cursor, datetime.datetime.fromisoformat, uuid.UUID)
+            stmt = stmt.where(
+                tuple_(Thread.created_at, Thread.id) < tuple_(cursor_created_at, cursor_id))
+        stmt = stmt.order_by(Thread.created_at.desc(), Thread.id.desc()).limit(limit + 1)
+
+        result = await db.execute(stmt)
         threads = result.scalars().all()
 
-        # Assuming Thread has a relationship 'thread_supports'
+        next_cursor = None
+        if len(threads) > limit:
+            threads = threads[:limit]
+            next_cursor = encode_cursor(threads[-1].created_at, threads[-1].id)
+
+        supports = await load_thread_supports([thread.id for thread in threads], user_id)
+
         threads_with_supports = []
         for thread in threads:
-            supports = await thread_supports.count_documents({"thread_id": thread.id})
-            is_supported = await thread_supports.find_one({"thread_id": thread.id, "user_id": user_id})
-            threads_with_supports.append({"thread": thread, "supports": supports, "is_supported": True if is_supported else False})
-
-        return threads_with_supports
+            thread_supports_state = supports[str(thread.id)]
+            threads_with_supports.append({
+                "thread": thread,
+                "supports": thread_supports_state["supports"],
+                "is_supported": thread_supports_state["is_supported"]
+            })
+
+        return {"threads": threads_with_supports, "next_cursor": next_cursor}
     except HTTPException:
         raise
     except Exception:
@@ -36,7 +103,7 @@ async def fetch_threads_by_issue_id(issue_id: str, user_id: str, db: Session):
             status_code=500, detail="Failed to fetch threads. Please try again later.")
 
 
-def create_thread_in_db(thread_data, user_id: str, db: Session):
+async def create_thread_in_db(thread_data, user_id: str, db: AsyncSession):
     try:
         if not user_id:
             raise HTTPException(status_code=400, detail="User ID is required.")
@@ -52,8 +119,8 @@ def create_thread_in_db(thread_data, user_id: str, db: Session):
             evidence_url=thread_data.evidence_url
         )
         db.add(new_thread)
-        db.commit()
-        db.refresh(new_thread)
+        await db.commit()
+        await db.refresh(new_thread)
         return new_thread
     except HTTPException:
         raise
@@ -62,7 +129,7 @@ def create_thread_in_db(thread_data, user_id: str, db: Session):
             status_code=500, detail="Failed to create thread. Please try again later.")
 
 
-def update_thread_in_db(thread_id: str, thread_data, user_id: str, db: Session):
+async def update_thread_in_db(thread_id: str, thread_data, user_id: str, db: AsyncSession):
     try:
         if not thread_id:
             raise HTTPException(
@@ -70,8 +137,8 @@ def update_thread_in_db(thread_id: str, thread_data, user_id: str, db: Session):
         if not user_id:
             raise HTTPException(status_code=400, detail="User ID is required.")
 
-        thread = db.query(Thread).filter(
-            Thread.id == thread_id, Thread.is_deleted == False).first()
+        thread = (await db.execute(select(Thread).where(
+            Thread.id == thread_id, Thread.is_deleted == False))).scalars().first()
         if not thread:
             raise HTTPException(
                 status_code=404, detail="Thread not found or has been deleted.")
@@ -79,8 +146,8 @@ def update_thread_in_db(thread_id: str, thread_data, user_id: str, db: Session):
         for key, value in thread_data.dict(exclude_unset=True).items():
             setattr(thread, key, value)
 
-        db.commit()
-        db.refresh(thread)
+        await db.commit()
+        await db.refresh(thread)
         return thread
     except HTTPException:
         raise
@@ -89,7 +156,7 @@ def update_thread_in_db(thread_id: str, thread_data, user_id: str, db: Session):
             status_code=500, detail="Failed to update thread. Please try again later.")
 
 
-def delete_thread_in_db(thread_id: str, user_id: str, db: Session):
+async def delete_thread_in_db(thread_id: str, user_id: str, db: AsyncSession):
     try:
         if not thread_id:
             raise HTTPException(
@@ -99,13 +166,13 @@ def delete_thread_in_db(thread_id: str, user_id: str, db: Session):
 
         stmt = select(Thread).where(
             Thread.id == thread_id, Thread.is_deleted == False)
-        thread = db.execute(stmt).scalar_one_or_none()
+        thread = (await db.execute(stmt)).scalar_one_or_none()
         if not thread:
             raise HTTPException(
                 status_code=404, detail="Thread not found or has been deleted.")
 
         thread.is_deleted = True
-        db.commit()
+        await db.commit()
         return {"message": "Thread deleted successfully."}
     except HTTPException:
         raise
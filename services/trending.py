@@ -0,0 +1,160 @@
+import asyncio
+import datetime
+import heapq
+import logging
+import math
+import os
+import time
+import uuid
+from sqlalchemy import any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+from models.issue import Issue
+from utils import mdb
+from utils.db import AsyncSessionLocal
+
+TRENDING_WINDOW_HOURS = int(os.getenv("TRENDING_WINDOW_HOURS", 72))
+TRENDING_HALF_LIFE_HOURS = float(os.getenv("TRENDING_HALF_LIFE_HOURS", 12))
+TRENDING_TOP_K = int(os.getenv("TRENDING_TOP_K", 50))
+TRENDING_REFRESH_SECONDS = float(os.getenv("TRENDING_REFRESH_SECONDS", 60))
+
+# A support says more about an issue than a passing view
+TRENDING_WEIGHTS = {"supports": 4.0, "shares": 3.0, "likes": 2.0, "views": 0.25}
+
+
+async def score_issues(now: datetime.datetime, window_hours: int, half_life_hours: float) -> dict:
+    """
+    Time-decayed engagement score for every issue active inside the window.
+
+    Each hourly bucket contributes its weighted counts scaled by
+    0.5 ** (age / half_life), where age is measured from the bucket's midpoint.
+
+    :return: Mapping of issue ID (str) to score.
+    """
+    current_hour = now.replace(minute=0, second=0, microsecond=0)
+    window_start = current_hour - datetime.timedelta(hours=window_hours - 1)
+    age_hours = {"$divide": [{"$subtract": [now, "$bucket"]}, 3600 * 1000]}
+    decay = {"$exp": {"$multiply": [
+        -math.log(2) / half_life_hours, {"$max": [{"$subtract": [age_hours, 0.5]}, 0]}]}}
+    weighted = {"$add": [
+        {"$multiply": [weight, {"$ifNull": [f"${field}", 0]}]}
+        for field, weight in TRENDING_WEIGHTS.items()
+    ]}
+    pipeline = [
+        {"$match": {"granularity": "hour", "bucket": {"$gte": window_start}}},
+        {"$group": {"_id": "$issue_id", "score": {"$sum": {"$multiply": [weighted, decay]}}}},
+        {"$match": {"score": {"$gt": 0}}},
+    ]
+    return {row["_id"]: row["score"] async for row in mdb.engagement_buckets.aggregate(pipeline)}
+
+
+async def _load_locations(issue_ids: list) -> dict:
+    ids = []
+    for issue_id in issue_ids:
+        try:
+            ids.append(uuid.UUID(issue_id))
+        except ValueError:
+            continue
+    if not ids:
+        return {}
+    async with AsyncSessionLocal() as db:
+        rows = await db.execute(
+            select(Issue.id, Issue.issue_headline, Issue.state, Issue.district)
+            # One array parameter; IN (...) would bind one parameter per active issue
+            .where(Issue.id == any_(bindparam("ids", ids, type_=ARRAY(PG_UUID(as_uuid=True)))),
+                   Issue.is_deleted == False)
+        )
+        return {str(row.id): row for row in rows}
+
+
+class TrendingEngine:
+    """
+    Keeps the top-K trending issues overall, per state and per district in memory.
+
+    A background task rescores every TRENDING_REFRESH_SECONDS from the hourly
+    engagement buckets and swaps in a fresh ranking, so reads never touch the
+    databases and cost O(K).
+    """
+
+    def __init__(self, top_k: int, refresh_seconds: float, window_hours: int, half_life_hours: float):
+        self.top_k = top_k
+        self.refresh_seconds = refresh_seconds
+        self.window_hours = window_hours
+        self.half_life_hours = half_life_hours
+        self._rankings = {"all": [], "state": {}, "district": {}}
+        self._task = None
+        self.refreshed_at = None
+        self.last_refresh_ms = 0.0
+
+    def _rank(self, entries: list) -> list:
+        return heapq.nlargest(self.top_k, entries, key=lambda entry: entry["score"])
+
+    async def refresh(self):
+        started = time.perf_counter()
+        now = datetime.datetime.utcnow()
+        scores = await score_issues(now, self.window_hours, self.half_life_hours)
+        issues = await _load_locations(list(scores))
+
+        by_state, by_district, entries = {}, {}, []
+        for issue_id, row in issues.items():
+            entry = {
+                "issue_id": issue_id,
+                "issue_headline": row.issue_headline,
+                "state": row.state,
+                "district": row.district,
+                "score": round(scores[issue_id], 4),
+            }
+            entries.append(entry)
+            if row.state:
+                by_state.setdefault(row.state, []).append(entry)
+                if row.district:
+                    by_district.setdefault((row.state, row.district), []).append(entry)
+
+        self._rankings = {
+            "all": self._rank(entries),
+            "state": {state: self._rank(group) for state, group in by_state.items()},
+            "district": {key: self._rank(group) for key, group in by_district.items()},
+        }
+        self.refreshed_at = now
+        self.last_refresh_ms = round((time.perf_counter() - started) * 1000, 3)
+
+    def top(self, state: str | None = None, district: str | None = None, limit: int | None = None) -> list:
+        """
+        Current ranking for a region.
+
+        :param state: Restrict to one state.
+        :param district: Restrict to one district; requires ``state`` since district names repeat.
+        :param limit: Number of entries to return, at most TRENDING_TOP_K.
+        """
+        rankings = self._rankings
+        if state and district:
+            ranking = rankings["district"].get((state, district), [])
+        elif state:
+            ranking = rankings["state"].get(state, [])
+        else:
+            ranking = rankings["all"]
+        return ranking[:limit or self.top_k]
+
+    async def _run(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logging.exception("Failed to refresh trending issues: %s", e)
+            await asyncio.sleep(self.refresh_seconds)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+trending_engine = TrendingEngine(
+    TRENDING_TOP_K, TRENDING_REFRESH_SECONDS, TRENDING_WINDOW_HOURS, TRENDING_HALF_LIFE_HOURS)
@@ -0,0 +1,67 @@
+import asyncio
+import uuid
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.save import Save
+from utils import mdb
+
+
+async def _mongo_targets(collection, field: str, viewer_id: str, target_ids: list) -> set:
+    if not target_ids:
+        return set()
+    cursor = collection.find({field: {"$in": target_ids}, "user_id": viewer_id}, {"_id": 0, field: 1})
+    return {str(doc[field]) async for doc in cursor}
+
+
+async def _saved_issues(db: AsyncSession, viewer_id: str, issue_ids: list) -> set:
+    if not issue_ids:
+        return set()
+    try:
+        viewer_uuid = uuid.UUID(viewer_id)
+    except ValueError:
+        return set()
+    saved = await db.execute(
+        select(Save.issue_id).where(
+            Save.user_id == viewer_uuid,
+            Save.issue_id.in_([uuid.UUID(issue_id) for issue_id in issue_ids]))
+    )
+    return {str(issue_id) for issue_id in saved.scalars()}
+
+
+async def resolve_viewer_state(
+    db: AsyncSession | None,
+    viewer_id: str | None,
+    issue_ids=(),
+    comment_ids=()
+) -> dict:
+    """
+    Resolve what the viewer has saved, supported or liked among a page of targets.
+
+    Issues cost one Save query plus one $in query each on issue_supports and
+    issue_likes; comments cost one $in query. The Mongo queries run
+    concurrently with the Save query. Thread supports are resolved together
+    with their counts by thread_services.load_thread_supports.
+
+    :param db: Session for the Save lookup; only needed when issue_ids are given.
+    :param viewer_id: User ID of the viewer, or None for anonymous viewers.
+    :return: Sets of target IDs (str) under "saved", "supported" and "liked"
+        (issues) and "liked_comments".
+    """
+    issue_ids = [str(issue_id) for issue_id in issue_ids]
+    comment_ids = [str(comment_id) for comment_id in comment_ids]
+    if not viewer_id:
+        return {"saved": set(), "supported": set(), "liked": set(), "liked_comments": set()}
+
+    viewer_id = str(viewer_id)
+    saved, supported, liked, liked_comments = await asyncio.gather(
+        _saved_issues(db, viewer_id, issue_ids),
+        _mongo_targets(mdb.issue_supports, "issue_id", viewer_id, issue_ids),
+        _mongo_targets(mdb.issue_likes, "issue_id", viewer_id, issue_ids),
+        _mongo_targets(mdb.comment_likes, "comment_id", viewer_id, comment_ids),
+    )
+    return {
+        "saved": saved,
+        "supported": supported,
+        "liked": liked,
+        "liked_comments": liked_comments,
+    }
@@ -0,0 +1,56 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """
+    Bounded LRU cache whose entries also expire after a fixed TTL.
+
+    Each entry can carry arbitrary metadata so callers can invalidate a
+    subset of keys with a predicate instead of clearing the whole cache.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value, meta=None):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value, meta)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, predicate) -> int:
+        """
+        Drop every entry whose metadata satisfies ``predicate``.
+
+        :param predicate: Callable receiving the metadata stored with each entry.
+        :return: Number of entries removed.
+        """
+        with self._lock:
+            stale = [key for key, (_, _, meta) in self._entries.items() if predicate(meta)]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -1,15 +1,59 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from utils.pool_metrics import InstrumentedAsyncQueuePool, InstrumentedQueuePool
 import dotenv
 import os
 
 dotenv.load_dotenv(".env")
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+# Same database through the asyncpg driver unless overridden explicitly
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or \
+    make_url(str(DATABASE_URL)).set(drivername="postgresql+asyncpg")
 
-engine = create_engine(str(DATABASE_URL))
+# Pool settings apply to the sync and the async engine separately
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+DB_CONNECT_TIMEOUT = int(os.getenv("DB_CONNECT_TIMEOUT", 10))
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", 30000))
+
+_pool_options = dict(
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=DB_POOL_PRE_PING,
+)
+
+engine = create_engine(
+    str(DATABASE_URL),
+    poolclass=InstrumentedQueuePool,
+    connect_args={
+        "connect_timeout": DB_CONNECT_TIMEOUT,
+        "options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}",
+    },
+    **_pool_options,
+)
 SessionLocal = sessionmaker(bind=engine)
 
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    poolclass=InstrumentedAsyncQueuePool,
+    connect_args={
+        "timeout": DB_CONNECT_TIMEOUT,
+        "server_settings": {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)},
+    },
+    **_pool_options,
+)
+# expire_on_commit=False keeps returned ORM objects readable after commit without lazy IO
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, class_=AsyncSession, expire_on_commit=False)
+
 
 def get_db():
     db = SessionLocal()
@@ -17,3 +61,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -65,6 +65,17 @@ def get_current_user(
     return payload
 
 
+def get_optional_user(
+    request: Request,
+    access_token_cookie: str = Cookie(None, alias="access_token"),
+):
+    """Like get_current_user, but returns None for anonymous or invalid sessions."""
+    try:
+        return get_current_user(request, access_token_cookie)
+    except HTTPException:
+        return None
+
+
 def refresh_access_token(refresh_token: str):
     payload = verify_token(refresh_token, token_type="refresh")
     user_data = {k: v for k, v in payload.items() if k not in ["exp", "type"]}
@@ -0,0 +1,98 @@
+import bisect
+
+LOCATION_LEVELS = ("state", "district", "taluk", "village")
+# Separates scope parts inside a key; sorts before any printable character
+_SEP = "\x1f"
+
+
+def normalize_location(value: str) -> str:
+    return " ".join(value.split()).casefold()
+
+
+class LocationIndex:
+    """
+    Sorted-array prefix index over distinct (state, district, taluk, village) paths.
+
+    Every location is indexed once per scope it can be searched in: a village is
+    reachable unscoped, within its state, within its district and within its
+    taluk. Each scope is a key prefix, so a scoped lookup is one bisect to the
+    first candidate followed by a walk of at most ``limit`` matches.
+    """
+
+    def __init__(self):
+        self._keys = {level: [] for level in LOCATION_LEVELS}
+        self._values = {level: [] for level in LOCATION_LEVELS}
+        self._paths = {}
+
+    @staticmethod
+    def _key(depth: int, scope: tuple, name: str) -> str:
+        return _SEP.join((str(depth), *scope, name))
+
+    @classmethod
+    def build(cls, paths) -> "LocationIndex":
+        """Index many (state, district, taluk, village) rows, sorting once at the end."""
+        index = cls()
+        entries = {level: [] for level in LOCATION_LEVELS}
+        for path in paths:
+            index._index(path, lambda level, key, entry: entries[level].append((key, entry)))
+        for level, pairs in entries.items():
+            pairs.sort(key=lambda pair: pair[0])
+            index._keys[level] = [key for key, _ in pairs]
+            index._values[level] = [entry for _, entry in pairs]
+        return index
+
+    def _insert(self, level: str, key: str, entry: dict):
+        keys = self._keys[level]
+        position = bisect.bisect_right(keys, key)
+        keys.insert(position, key)
+        self._values[level].insert(position, entry)
+
+    def add(self, state=None, district=None, taluk=None, village=None) -> bool:
+        """
+        Index a location path and each of its ancestors.
+
+        :return: True when anything new was indexed.
+        """
+        return self._index((state, district, taluk, village), self._insert)
+
+    def _index(self, path, insert) -> bool:
+        location, normalized = (), ()
+        added = False
+        for level, value in zip(LOCATION_LEVELS, path):
+            value = " ".join(value.split()) if isinstance(value, str) else None
+            if not value:
+                break
+            normalized += (normalize_location(value),)
+            # Spelling variants that only differ in case or spacing share the first one seen
+            if normalized in self._paths:
+                location = self._paths[normalized]
+                continue
+            location += (value,)
+            self._paths[normalized] = location
+            added = True
+
+            entry = dict(zip(LOCATION_LEVELS, location))
+            for depth in range(len(location)):
+                insert(level, self._key(depth, normalized[:depth], normalized[-1]), entry)
+        return added
+
+    def suggest(self, level: str, prefix: str, scope: tuple = (), limit: int = 10) -> list:
+        """
+        Locations at ``level`` whose name starts with ``prefix``.
+
+        :param level: One of LOCATION_LEVELS.
+        :param scope: Leading ancestors to search within, e.g. (state, district).
+        :return: Up to ``limit`` location dicts in alphabetical order.
+        """
+        keys, values = self._keys[level], self._values[level]
+        start = self._key(len(scope), tuple(normalize_location(part) for part in scope),
+                          normalize_location(prefix))
+        suggestions = []
+        position = bisect.bisect_left(keys, start)
+        while position < len(keys) and len(suggestions) < limit and keys[position].startswith(start):
+            suggestions.append(values[position])
+            position += 1
+        return suggestions
+
+    def __len__(self):
+        return len(self._paths)
@@ -1,4 +1,5 @@
 from motor.motor_asyncio import AsyncIOMotorClient
+from utils.pool_metrics import MongoPoolListener
 import os
 import dotenv
 
@@ -6,9 +7,22 @@ import dotenv
 dotenv.load_dotenv(".env")
 
 MONGO_URL = os.getenv("MONGO_URL")
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", 100))
+MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", 0))
+MONGO_MAX_IDLE_TIME_MS = int(os.getenv("MONGO_MAX_IDLE_TIME_MS", 300000))
+MONGO_WAIT_QUEUE_TIMEOUT_MS = int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", 10000))
+MONGO_CONNECT_TIMEOUT_MS = int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", 10000))
+
+pool_listener = MongoPoolListener()
 
 client = AsyncIOMotorClient(
-    MONGO_URL, uuidRepresentation="standard")
+    MONGO_URL, uuidRepresentation="standard",
+    maxPoolSize=MONGO_MAX_POOL_SIZE,
+    minPoolSize=MONGO_MIN_POOL_SIZE,
+    maxIdleTimeMS=MONGO_MAX_IDLE_TIME_MS,
+    waitQueueTimeoutMS=MONGO_WAIT_QUEUE_TIMEOUT_MS,
+    connectTimeoutMS=MONGO_CONNECT_TIMEOUT_MS,
+    event_listeners=[pool_listener])
 db = client["iu"]
 
 # Collections
@@ -18,6 +32,13 @@ issue_shares = db["issue_shares"]
 comment_likes = db["comment_likes"]
 thread_supports = db["thread_supports"]
 issue_views = db["issue_views"]
+issue_stats = db["issue_stats"]
+engagement_buckets = db["issue_engagement_buckets"]
+# One document per one-off data migration that has been applied
+migrations = db["migrations"]
+
+# Hourly rollups only need to outlive the longest window stitched from them
+HOURLY_BUCKET_RETENTION_DAYS = int(os.getenv("HOURLY_BUCKET_RETENTION_DAYS", 7))
 
 async def test_connection():
     try:
@@ -45,4 +66,12 @@ async def init_indexes():
     # Create indexes for issue_views
     await issue_views.create_index([("issue_id", 1), ("views", 1)], unique=True)
     
+    # Create indexes for issue_engagement_buckets
+    await engagement_buckets.create_index(
+        [("issue_id", 1), ("granularity", 1), ("bucket", 1)], unique=True)
+    await engagement_buckets.create_index(
+        [("bucket", 1)],
+        expireAfterSeconds=HOURLY_BUCKET_RETENTION_DAYS * 86400,
+        partialFilterExpression={"granularity": "hour"})
+    
     await test_connection()
\ No newline at end of file
@@ -0,0 +1,138 @@
+import importlib.util
+import logging
+import os
+import re
+import sys
+from sqlalchemy import text
+from utils.db import engine
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "migrations")
+MIGRATION_FILE = re.compile(r"^(\d{4})_(\w+)\.py$")
+# Arbitrary key so that only one process applies migrations at a time
+MIGRATION_LOCK_ID = 72130431
+
+
+def load_migrations():
+    """
+    Discover migration modules in migrations/ ordered by version.
+
+    Each module defines ``upgrade`` and ``downgrade`` lists of SQL statements and
+    may set ``transactional = False`` for statements such as
+    ``CREATE INDEX CONCURRENTLY`` that cannot run inside a transaction block.
+
+    :return: List of (version, name, module) tuples.
+    """
+    migrations = []
+    for filename in sorted(os.listdir(MIGRATIONS_DIR)):
+        match = MIGRATION_FILE.match(filename)
+        if not match:
+            continue
+        version, name = match.groups()
+        spec = importlib.util.spec_from_file_location(
+            f"migrations.{version}_{name}", os.path.join(MIGRATIONS_DIR, filename))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        migrations.append((version, name, module))
+    return migrations
+
+
+def _ensure_version_table(conn):
+    conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS schema_migrations ("
+        " version VARCHAR PRIMARY KEY,"
+        " name VARCHAR NOT NULL,"
+        " applied_at TIMESTAMPTZ NOT NULL DEFAULT now())"
+    ))
+
+
+def applied_versions(conn) -> set:
+    _ensure_version_table(conn)
+    return {row[0] for row in conn.execute(text("SELECT version FROM schema_migrations"))}
+
+
+def _run_statements(statements, transactional: bool):
+    if transactional:
+        with engine.begin() as conn:
+            for statement in statements:
+                conn.execute(text(statement))
+    else:
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            for statement in statements:
+                conn.execute(text(statement))
+
+
+def upgrade(target: str | None = None):
+    """
+    Apply every pending migration up to and including ``target``.
+
+    :param target: Version to stop at, or None to apply everything.
+    :return: Versions that were applied.
+    """
+    applied = []
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as lock_conn:
+        lock_conn.execute(text("SELECT pg_advisory_lock(:id)"), {"id": MIGRATION_LOCK_ID})
+        try:
+            done = applied_versions(lock_conn)
+            for version, name, module in load_migrations():
+                if target and version > target:
+                    break
+                if version in done:
+                    continue
+                logging.info("Applying migration %s_%s", version, name)
+                _run_statements(module.upgrade, getattr(module, "transactional", True))
+                lock_conn.execute(
+                    text("INSERT INTO schema_migrations (version, name) VALUES (:version, :name)"),
+                    {"version": version, "name": name})
+                applied.append(version)
+        finally:
+            lock_conn.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": MIGRATION_LOCK_ID})
+    return applied
+
+
+def downgrade(target: str):
+    """
+    Revert applied migrations newer than ``target``, newest first.
+
+    :param target: Version to keep; use "0000" to revert everything.
+    :return: Versions that were reverted.
+    """
+    reverted = []
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as lock_conn:
+        lock_conn.execute(text("SELECT pg_advisory_lock(:id)"), {"id": MIGRATION_LOCK_ID})
+        try:
+            done = applied_versions(lock_conn)
+            for version, name, module in reversed(load_migrations()):
+                if version <= target or version not in done:
+                    continue
+                logging.info("Reverting migration %s_%s", version, name)
+                _run_statements(module.downgrade, getattr(module, "transactional", True))
+                lock_conn.execute(
+                    text("DELETE FROM schema_migrations WHERE version = :version"),
+                    {"version": version})
+                reverted.append(version)
+        finally:
+            lock_conn.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": MIGRATION_LOCK_ID})
+    return reverted
+
+
+def status():
+    with engine.connect() as conn:
+        done = applied_versions(conn)
+        conn.commit()
+    return [(version, name, version in done) for version, name, _ in load_migrations()]
+
+
+if __name__ == "__main__":
+    # python -m utils.migrations [upgrade [version] | downgrade <version> | status]
+    logging.basicConfig(level=logging.INFO)
+    command = sys.argv[1] if len(sys.argv) > 1 else "upgrade"
+    if command == "upgrade":
+        print("Applied:", upgrade(sys.argv[2] if len(sys.argv) > 2 else None))
+    elif command == "downgrade" and len(sys.argv) > 2:
+        print("Reverted:", downgrade(sys.argv[2]))
+    elif command == "status":
+        for version, name, is_applied in status():
+            print(f"{version}_{name}: {'applied' if is_applied else 'pending'}")
+    else:
+        print("Usage: python -m utils.migrations [upgrade [version] | downgrade <version> | status]")
+        sys.exit(1)
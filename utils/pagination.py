@@ -0,0 +1,44 @@
+import base64
+import datetime
+import json
+import uuid
+from fastapi import HTTPException
+
+
+def _to_json(value):
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    raise TypeError(f"Cannot encode {type(value).__name__} in a cursor")
+
+
+def encode_cursor(*values) -> str:
+    """
+    Pack the sort key of the last row on a page into an opaque token.
+
+    :param values: Sort key values, e.g. (created_at, id).
+    :return: URL-safe cursor string.
+    """
+    payload = json.dumps(list(values), default=_to_json, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types) -> tuple:
+    """
+    Unpack a token produced by encode_cursor.
+
+    :param cursor: Cursor string from a previous response.
+    :param types: Converters applied to each value, e.g. (datetime.datetime.fromisoformat, uuid.UUID).
+    :return: Tuple of converted sort key values.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if types:
+            if len(values) != len(types):
+                raise ValueError("cursor arity mismatch")
+            values = [convert(value) for convert, value in zip(types, values)]
+        return tuple(values)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
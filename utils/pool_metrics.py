@@ -0,0 +1,135 @@
+import threading
+import time
+from pymongo import monitoring
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class WaitStats:
+    """Running totals of how long callers waited to check out a connection."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, seconds: float, timed_out: bool = False):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait / attempts * 1000, 3) if attempts else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+            }
+
+
+def _timed_get(stats: WaitStats, get):
+    started = time.perf_counter()
+    try:
+        connection = get()
+    except PoolTimeoutError:
+        stats.record(time.perf_counter() - started, timed_out=True)
+        raise
+    stats.record(time.perf_counter() - started)
+    return connection
+
+
+class InstrumentedQueuePool(QueuePool):
+    wait_stats = WaitStats()
+
+    def _do_get(self):
+        return _timed_get(self.wait_stats, super()._do_get)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    wait_stats = WaitStats()
+
+    def _do_get(self):
+        return _timed_get(self.wait_stats, super()._do_get)
+
+
+def sql_pool_snapshot(pool) -> dict:
+    snapshot = {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+    }
+    snapshot.update(pool.wait_stats.snapshot())
+    return snapshot
+
+
+class MongoPoolListener(monitoring.ConnectionPoolListener):
+    """Tracks open and checked-out connections for every server the client uses."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.open = 0
+        self.checked_out = 0
+        self.wait_stats = WaitStats()
+
+    def _adjust(self, open_delta: int = 0, checked_out_delta: int = 0):
+        with self._lock:
+            self.open += open_delta
+            self.checked_out += checked_out_delta
+
+    def connection_created(self, event):
+        self._adjust(open_delta=1)
+
+    def connection_closed(self, event):
+        self._adjust(open_delta=-1)
+
+    def connection_checked_out(self, event):
+        self._adjust(checked_out_delta=1)
+        # duration is reported by pymongo >= 4.7
+        duration = getattr(event, "duration", None)
+        if duration is not None:
+            self.wait_stats.record(duration)
+
+    def connection_checked_in(self, event):
+        self._adjust(checked_out_delta=-1)
+
+    def connection_check_out_failed(self, event):
+        if event.reason == monitoring.ConnectionCheckOutFailedReason.TIMEOUT:
+            self.wait_stats.record(getattr(event, "duration", None) or 0.0, timed_out=True)
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def snapshot(self, max_pool_size: int, min_pool_size: int) -> dict:
+        with self._lock:
+            snapshot = {
+                "max_pool_size": max_pool_size,
+                "min_pool_size": min_pool_size,
+                "checked_out": self.checked_out,
+                "idle": max(self.open - self.checked_out, 0),
+            }
+        snapshot.update(self.wait_stats.snapshot())
+        return snapshot